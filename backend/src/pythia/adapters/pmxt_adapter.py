@@ -6,10 +6,12 @@ Dependencies: pmxt>=1.0.0.
 Edge cases handled:
 1. Missing credentials -> Graceful degradation / ValueErrors.
 2. Market fetching failures -> Re-raised as PmxtAdapterError.
+   Upstream throttling (HTTP 429) -> PmxtRateLimitError.
 3. Interface mapping bridging (volume extraction).
 """
 
 # Step-1: Import abstractions and libraries
+import asyncio
 import logging
 
 import pmxt
@@ -24,6 +26,22 @@ class PmxtAdapterError(Exception):
     pass
 
 
+class PmxtRateLimitError(PmxtAdapterError):
+    """Raised when a platform throttles requests (HTTP 429)."""
+
+    pass
+
+
+def _is_rate_limited(exc: Exception) -> bool:
+    response = getattr(exc, "response", None)
+    status = (
+        getattr(exc, "status_code", None)
+        or getattr(exc, "status", None)
+        or getattr(response, "status_code", None)
+    )
+    return status == 429
+
+
 class PmxtAdapter(TradingPort, MarketDataPort):
     """Prediction Markets Adapter for Kalshi & Polymarket."""
 
@@ -72,10 +90,14 @@ class PmxtAdapter(TradingPort, MarketDataPort):
         assert limit > 0, "Limit must be positive."
         try:
             client = self._get_client(platform)
-            markets = client.fetch_markets(limit=limit)
+            # The pmxt clients are blocking; run them off-loop so fetches
+            # for several platforms can overlap.
+            markets = await asyncio.to_thread(client.fetch_markets, limit=limit)
             logger.info(f"✅ Fetched {len(markets)} markets from {platform}")
             return markets
         except Exception as e:
+            if _is_rate_limited(e):
+                raise PmxtRateLimitError(f"Rate limited by {platform}: {e}") from e
             raise PmxtAdapterError(f"Market fetch failed on {platform}: {e}") from e
 
     async def fetch_ticker(self, symbol: str) -> dict:
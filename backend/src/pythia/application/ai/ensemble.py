@@ -28,7 +28,7 @@ class AIModelEnsemble:
         """
         self.models = models
         self.voting_strategy = voting_strategy
-        self.model_weights = [1.0 / len(models)] * len(models)
+        self.model_weights = np.full(len(models), 1.0 / len(models))
 
     def predict(self, state: np.ndarray, training: bool = False) -> tuple[int, float]:
         """
@@ -105,7 +105,7 @@ class AIModelEnsemble:
         Args:
             trade_results: List of P&L results for each model's predictions
         """
-        performance = np.array(trade_results)
+        performance = np.asarray(trade_results, dtype=np.float64)
         exp_perf = np.exp(performance - np.max(performance))
         self.model_weights = exp_perf / np.sum(exp_perf)
         logger.info(f"Updated model weights: {self.model_weights}")
@@ -114,7 +114,7 @@ class AIModelEnsemble:
         """Add a new model to the ensemble"""
         self.models.append(model)
         n = len(self.models)
-        self.model_weights = [1.0 / n] * n
+        self.model_weights = np.full(n, 1.0 / n)
         logger.info(f"Added model to ensemble. Total models: {n}")
 
     def get_ensemble_metrics(self) -> dict:
@@ -122,9 +122,7 @@ class AIModelEnsemble:
         return {
             "num_models": len(self.models),
             "voting_strategy": self.voting_strategy,
-            "model_weights": self.model_weights.tolist()
-            if hasattr(self.model_weights, "tolist")
-            else self.model_weights,
+            "model_weights": self.model_weights.tolist(),
             "avg_epsilon": np.mean([m.epsilon for m in self.models]),
         }
 
@@ -6,6 +6,8 @@ Compares probabilistic AI signals with deterministic Technical Analysis (TA) gro
 import logging
 from datetime import datetime
 
+import numpy as np
+
 from pythia.application.ai.specialized_agents import TechnicalAnalysisAgent
 from pythia.domain.cognitive.models import TradingSignal
 
@@ -40,7 +42,38 @@ class SignalBacktester:
 
         ta_report = self.ta_agent.analyze_trend(market_prices)
         ta_direction = ta_report["direction"]  # bullish, bearish, neutral
+        return self._record(signal, ta_direction)
+
+    def evaluate_signals_batch(
+        self, signal: TradingSignal, prices_matrix: np.ndarray
+    ) -> list[dict]:
+        """
+        Evaluate one signal against many price windows in a single pass.
 
+        Applies the TechnicalAnalysisAgent SMA(5)/SMA(20) trend rule to every
+        row of ``prices_matrix`` (shape ``(n_windows, n_prices)``) at once.
+
+        Returns:
+            One evaluation report per row, in row order.
+        """
+        prices_matrix = np.asarray(prices_matrix, dtype=np.float64)
+        if prices_matrix.ndim != 2 or prices_matrix.shape[1] < 20:
+            return [
+                {"error": "Insufficient price data for TA ground truth"}
+                for _ in range(len(prices_matrix))
+            ]
+
+        sma_short = prices_matrix[:, -5:].mean(axis=1)
+        sma_long = prices_matrix[:, -20:].mean(axis=1)
+        directions = np.select(
+            [sma_short > sma_long * 1.02, sma_short < sma_long * 0.98],
+            ["bullish", "bearish"],
+            default="neutral",
+        )
+        return [self._record(signal, str(direction)) for direction in directions]
+
+    def _record(self, signal: TradingSignal, ta_direction: str) -> dict:
+        """Score a signal against a TA direction and append it to history."""
         # Map Signal Action to TA Direction
         action_map = {"BUY": "bullish", "SELL": "bearish", "HOLD": "neutral"}
         expected_direction = action_map.get(signal.action, "neutral")
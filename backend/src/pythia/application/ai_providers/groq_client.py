@@ -12,6 +12,25 @@ from pythia.domain.cognitive.models import TradingSignal
 
 logger = logging.getLogger(__name__)
 
+# Prompt shapes are fixed; bind the templates once and only substitute values.
+_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are an AI trading expert. You only output valid JSON representing a TradingSignal.",  # noqa: E501
+}
+_CRYPTO_PROMPT = (
+    "Analyze {pair} market. Recent price: {price}, RSI: {rsi}, "
+    "EMA signals: (fast: {ema_fast}, slow: {ema_slow}). "
+    "Output JSON ONLY with action (BUY/SELL/HOLD), confidence (0.0-1.0) as float, reason (<280 chars), and pair '{pair}'."  # noqa: E501
+).format
+_STOCK_PROMPT = (
+    "Analyze US Stock {symbol}. \n"
+    "Price: ${price}, RSI: {rsi}, MACD: {macd_signal}. \n"
+    "Earnings Sentiment: {earnings_sentiment}. \n"
+    "Recent News Recap: {news_summary}. \n"
+    "Factor in earnings quality and news volatility. "
+    "Output JSON ONLY: action (BUY/SELL/HOLD), confidence (0.0-1.0), reason (<280 chars), and pair '{symbol}'."  # noqa: E501
+).format
+
 
 class GroqRateLimiter:
     """Rate limiter semplice per 30 RPM (Thread MVP zero-cost)."""
@@ -50,10 +69,8 @@ class GroqClient:
                 action="HOLD", confidence=0.0, pair=pair, reason="NO_API_KEY"
             )
 
-        prompt = (
-            f"Analyze {pair} market. Recent price: {price}, RSI: {rsi}, "
-            f"EMA signals: (fast: {ema_fast}, slow: {ema_slow}). "
-            f"Output JSON ONLY with action (BUY/SELL/HOLD), confidence (0.0-1.0) as float, reason (<280 chars), and pair '{pair}'."  # noqa: E501
+        prompt = _CRYPTO_PROMPT(
+            pair=pair, price=price, rsi=rsi, ema_fast=ema_fast, ema_slow=ema_slow
         )
         return await self._execute_groq_request(prompt, pair)
 
@@ -72,13 +89,13 @@ class GroqClient:
                 action="HOLD", confidence=0.0, pair=symbol, reason="NO_API_KEY"
             )
 
-        prompt = (
-            f"Analyze US Stock {symbol}. \n"
-            f"Price: ${price}, RSI: {rsi}, MACD: {macd_signal}. \n"
-            f"Earnings Sentiment: {earnings_sentiment}. \n"
-            f"Recent News Recap: {news_summary}. \n"
-            f"Factor in earnings quality and news volatility. "
-            f"Output JSON ONLY: action (BUY/SELL/HOLD), confidence (0.0-1.0), reason (<280 chars), and pair '{symbol}'."  # noqa: E501
+        prompt = _STOCK_PROMPT(
+            symbol=symbol,
+            price=price,
+            rsi=rsi,
+            macd_signal=macd_signal,
+            earnings_sentiment=earnings_sentiment,
+            news_summary=news_summary,
         )
         return await self._execute_groq_request(prompt, symbol)
 
@@ -94,13 +111,7 @@ class GroqClient:
                 await self.rate_limiter.wait()
 
                 chat_completion = await self.client.chat.completions.create(
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are an AI trading expert. You only output valid JSON representing a TradingSignal.",  # noqa: E501
-                        },
-                        {"role": "user", "content": prompt},
-                    ],
+                    messages=[_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
                     model="llama3-8b-8192",
                     response_format={"type": "json_object"},
                     temperature=0.1,
@@ -243,8 +243,11 @@ class BacktestEngine:
         )
 
         max_drawdown = self._calculate_max_drawdown()
-        sharpe = self._calculate_sharpe_ratio()
-        sortino = self._calculate_sortino_ratio()
+        # Equity-curve returns depend only on engine state; derive them once
+        # for both ratios.
+        returns = self._get_returns()
+        sharpe = self._calculate_sharpe_ratio(returns=returns)
+        sortino = self._calculate_sortino_ratio(returns=returns)
         calmar = self._calculate_calmar_ratio(total_return_pct, max_drawdown)
 
         return BacktestResults(
@@ -292,9 +295,12 @@ class BacktestEngine:
                 max_dd = dd
         return Decimal(str(max_dd * 100))
 
-    def _calculate_sharpe_ratio(self, risk_free_rate: float = 0.02) -> Decimal:
+    def _calculate_sharpe_ratio(
+        self, risk_free_rate: float = 0.02, returns: list[float] | None = None
+    ) -> Decimal:
         """Annualised Sharpe ratio (252-day convention)."""
-        returns = self._get_returns()
+        if returns is None:
+            returns = self._get_returns()
         if not returns:
             return Decimal("0.0")
         arr = np.array(returns, dtype=float)
@@ -304,9 +310,12 @@ class BacktestEngine:
         sharpe = (float(np.mean(arr)) - risk_free_rate / 252) / std * np.sqrt(252)
         return Decimal(str(round(sharpe, 4)))
 
-    def _calculate_sortino_ratio(self, risk_free_rate: float = 0.02) -> Decimal:
+    def _calculate_sortino_ratio(
+        self, risk_free_rate: float = 0.02, returns: list[float] | None = None
+    ) -> Decimal:
         """Sortino ratio — penalises only downside volatility."""
-        returns = self._get_returns()
+        if returns is None:
+            returns = self._get_returns()
         if not returns:
             return Decimal("0.0")
         arr = np.array(returns, dtype=float)
@@ -2,6 +2,7 @@ import logging
 from datetime import datetime
 from typing import Any
 
+import numpy as np
 import yfinance as yf
 
 logger = logging.getLogger(__name__)
@@ -106,57 +107,35 @@ class MarketDataService:
         """
         if len(history) < 20:
             return {}
-        closes = [d["close"] for d in history]
-        sma_20 = sum(closes[-20:]) / 20
-        sma_50 = sum(closes[-50:]) / 50 if len(closes) >= 50 else None
-
-        def calculate_rsi(prices, period=14):
-            if len(prices) < period + 1:
-                return 50.0
-            gains = []
-            losses = []
-            for i in range(1, len(prices)):
-                change = prices[i] - prices[i - 1]
-                gains.append(max(change, 0))
-                losses.append(abs(min(change, 0)))
-            avg_gain = sum(gains[-period:]) / period
-            avg_loss = sum(losses[-period:]) / period
-            if avg_loss == 0:
-                return 100.0
-            rs = avg_gain / avg_loss
-            rsi = 100 - 100 / (1 + rs)
-            return rsi
-
-        rsi = calculate_rsi(closes)
+        closes = np.fromiter(
+            (d["close"] for d in history), dtype=np.float64, count=len(history)
+        )
+        sma_50 = self.calculate_sma(closes, 50) if len(closes) >= 50 else None
         return {
-            "sma_20": sma_20,
+            "sma_20": self.calculate_sma(closes, 20),
             "sma_50": sma_50,
-            "rsi": rsi,
-            "current_price": closes[-1],
+            "rsi": self.calculate_rsi(closes),
+            "current_price": float(closes[-1]),
         }
 
-    def calculate_sma(self, prices: list[float], period: int) -> float:
+    def calculate_sma(self, prices: list[float] | np.ndarray, period: int) -> float:
         """Calculate Simple Moving Average"""
         if len(prices) < period:
             return 0.0
-        return sum(prices[-period:]) / period
+        return float(np.mean(np.asarray(prices, dtype=np.float64)[-period:]))
 
-    def calculate_rsi(self, prices: list[float], period: int = 14) -> float:
+    def calculate_rsi(self, prices: list[float] | np.ndarray, period: int = 14) -> float:
         """Calculate Relative Strength Index"""
         if len(prices) < period + 1:
             return 50.0
-        gains = []
-        losses = []
-        for i in range(1, len(prices)):
-            change = prices[i] - prices[i - 1]
-            gains.append(max(change, 0))
-            losses.append(abs(min(change, 0)))
-        avg_gain = sum(gains[-period:]) / period
-        avg_loss = sum(losses[-period:]) / period
+        # Only the last ``period`` price changes feed the averages.
+        delta = np.diff(np.asarray(prices, dtype=np.float64)[-(period + 1) :])
+        avg_gain = np.maximum(delta, 0.0).sum() / period
+        avg_loss = -np.minimum(delta, 0.0).sum() / period
         if avg_loss == 0:
             return 100.0
         rs = avg_gain / avg_loss
-        return 100 - 100 / (1 + rs)
+        return float(100 - 100 / (1 + rs))
 
 
 market_data_service = MarketDataService()
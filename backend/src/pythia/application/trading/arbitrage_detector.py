@@ -1,29 +1,73 @@
 import logging
 from difflib import SequenceMatcher
+from typing import NamedTuple
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
 
+class ArbitrageOpportunity(NamedTuple):
+    """Compact opportunity record for transport.
+
+    Serializes as a plain ``[roi, strategy]`` row, so field names are not
+    repeated per opportunity; rebuild with ``ArbitrageOpportunity._make(row)``.
+    """
+
+    roi: float
+    strategy: str
+
+
 class ArbitrageDetector:
     def __init__(self, min_roi: float = 0.01):
         self.min_roi = min_roi
 
     def find_opportunities(self, kalshi_markets, polymarket_markets) -> list[dict]:
         opportunities = []
+        if not kalshi_markets or not polymarket_markets:
+            return opportunities
 
-        for k_market in kalshi_markets:
-            for p_market in polymarket_markets:
-                if self._markets_match(k_market, p_market):
-                    arb = k_market.arbitrage_opportunity(p_market)
+        for i, j in self._candidate_pairs(kalshi_markets, polymarket_markets):
+            k_market = kalshi_markets[i]
+            p_market = polymarket_markets[j]
+            if self._markets_match(k_market, p_market):
+                arb = k_market.arbitrage_opportunity(p_market)
 
-                    if arb and arb["roi"] >= self.min_roi:
-                        opportunities.append(arb)
-                        logger.info(f"🎯 Arbitrage: {arb['roi'] * 100:.2f}% ROI")
+                if arb and arb["roi"] >= self.min_roi:
+                    opportunities.append(arb)
+                    logger.info(f"🎯 Arbitrage: {arb['roi'] * 100:.2f}% ROI")
 
         return opportunities
 
+    def _candidate_pairs(self, kalshi_markets, polymarket_markets) -> np.ndarray:
+        """Return (kalshi, polymarket) index pairs whose prices clear min_roi.
+
+        Both legs (YES+NO and NO+YES) are priced for the whole N x M grid in
+        one broadcast, so description matching only runs on viable pairs.
+        """
+        n, m = len(kalshi_markets), len(polymarket_markets)
+        k_yes = np.fromiter((mk.yes_price for mk in kalshi_markets), dtype=np.float64, count=n)
+        k_no = np.fromiter((mk.no_price for mk in kalshi_markets), dtype=np.float64, count=n)
+        p_yes = np.fromiter((mk.yes_price for mk in polymarket_markets), dtype=np.float64, count=m)
+        p_no = np.fromiter((mk.no_price for mk in polymarket_markets), dtype=np.float64, count=m)
+
+        forward_cost = k_yes[:, None] + p_no[None, :]
+        reverse_cost = k_no[:, None] + p_yes[None, :]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            forward_roi = np.where(
+                forward_cost < 1.0, (1.0 - forward_cost) / forward_cost, -np.inf
+            )
+            reverse_roi = np.where(
+                reverse_cost < 1.0, (1.0 - reverse_cost) / reverse_cost, -np.inf
+            )
+
+        return np.argwhere(np.maximum(forward_roi, reverse_roi) >= self.min_roi)
+
     def _markets_match(self, market1, market2) -> bool:
-        desc1 = market1.description.lower().strip()
-        desc2 = market2.description.lower().strip()
-        similarity = SequenceMatcher(None, desc1, desc2).ratio()
-        return similarity > 0.8
+        matcher = SequenceMatcher(None, market1.match_key, market2.match_key)
+        # real_quick_ratio (length bound) and quick_ratio (character multiset
+        # bound) are upper bounds on ratio, so rejecting on them never drops
+        # a pair that the full comparison would accept.
+        if matcher.real_quick_ratio() <= 0.8 or matcher.quick_ratio() <= 0.8:
+            return False
+        return matcher.ratio() > 0.8
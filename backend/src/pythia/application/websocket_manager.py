@@ -5,8 +5,10 @@ Provides real-time portfolio and market data updates to connected clients.
 P0-1 FIX: Added JWT authentication for WebSocket connections.
 """
 
+import asyncio
 import json
 import logging
+from collections import defaultdict
 from datetime import datetime
 
 from fastapi import WebSocket, WebSocketDisconnect, status
@@ -29,7 +31,7 @@ class ConnectionManager:
 
     def __init__(self):
         self.active_connections: set[WebSocket] = set()
-        self.portfolio_subscribers: dict[int | str, set[WebSocket]] = {}
+        self.portfolio_subscribers: defaultdict[int | str, set[WebSocket]] = defaultdict(set)
 
     async def connect(self, websocket: WebSocket):
         """Accept and store new connection"""
@@ -53,51 +55,41 @@ class ConnectionManager:
 
     async def subscribe_portfolio(self, websocket: WebSocket, portfolio_id: int):
         """Subscribe to portfolio updates"""
-        if portfolio_id not in self.portfolio_subscribers:
-            self.portfolio_subscribers[portfolio_id] = set()
-
         self.portfolio_subscribers[portfolio_id].add(websocket)
         logger.info("Client subscribed to portfolio %s", portfolio_id)
 
-    async def broadcast(self, message: dict):
-        """Broadcast message to all connected clients"""
-        disconnected = set()
+    async def _fan_out(self, connections, message: dict):
+        """Encode message once and send it to every connection concurrently"""
+        targets = tuple(connections)
+        if not targets:
+            return
 
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except (RuntimeError, WebSocketDisconnect):
-                # Connection is already closed or closing
-                disconnected.add(connection)
-            except Exception:  # noqa: BLE001
-                logger.exception("Unexpected error broadcasting to client")
-                disconnected.add(connection)
+        # Same text frame WebSocket.send_json would produce, built once
+        payload = json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+        results = await asyncio.gather(
+            *(connection.send_text(payload) for connection in targets),
+            return_exceptions=True,
+        )
 
         # Clean up disconnected clients
-        for conn in disconnected:
-            self.disconnect(conn)
+        for connection, result in zip(targets, results, strict=True):
+            if isinstance(result, (RuntimeError, WebSocketDisconnect)):
+                # Connection is already closed or closing
+                self.disconnect(connection)
+            elif isinstance(result, Exception):
+                logger.error("Unexpected error sending to client", exc_info=result)
+                self.disconnect(connection)
+
+    async def broadcast(self, message: dict):
+        """Broadcast message to all connected clients"""
+        await self._fan_out(self.active_connections, message)
 
     async def send_to_portfolio_subscribers(self, portfolio_id: int, message: dict):
         """Send message to all subscribers of a specific portfolio"""
         if portfolio_id not in self.portfolio_subscribers:
             return
 
-        disconnected = set()
-        subscribers = self.portfolio_subscribers[portfolio_id]
-
-        for connection in subscribers:
-            try:
-                await connection.send_json(message)
-            except (RuntimeError, WebSocketDisconnect):
-                # Connection is already closed or closing
-                disconnected.add(connection)
-            except Exception:  # noqa: BLE001
-                logger.exception("Unexpected error sending to subscriber")
-                disconnected.add(connection)
-
-        # Clean up disconnected clients
-        for conn in disconnected:
-            self.disconnect(conn)
+        await self._fan_out(self.portfolio_subscribers[portfolio_id], message)
 
     async def send_portfolio_update(self, portfolio_id: int, data: dict):
         """Send portfolio update to subscribers"""
@@ -239,8 +231,6 @@ async def intelligence_feed_websocket_endpoint(websocket: WebSocket):
     await connection_manager.connect(websocket)
 
     # Track intent subscription explicitly for isolated intelligence feeds
-    if "intelligence_feed" not in connection_manager.portfolio_subscribers:
-        connection_manager.portfolio_subscribers["intelligence_feed"] = set()
     connection_manager.portfolio_subscribers["intelligence_feed"].add(websocket)
 
     try:
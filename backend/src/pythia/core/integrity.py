@@ -9,8 +9,13 @@ of the previous entry, creating an immutable chain.
 import hashlib
 import json
 import time
+from itertools import islice, pairwise
 from typing import Any
 
+# Same output as json.dumps(..., sort_keys=True) without building a fresh
+# encoder for every entry hashed.
+_canonical_json = json.JSONEncoder(sort_keys=True).encode
+
 
 class MerkleLogEntry:
     def __init__(
@@ -23,14 +28,13 @@ class MerkleLogEntry:
         self.hash = self._compute_hash()
 
     def _compute_hash(self) -> str:
-        payload = json.dumps(
+        payload = _canonical_json(
             {
                 "index": self.index,
                 "timestamp": self.timestamp,
                 "data": self.data,
                 "prev_hash": self.prev_hash,
-            },
-            sort_keys=True,
+            }
         )
         return hashlib.sha256(payload.encode()).hexdigest()
 
@@ -62,14 +66,12 @@ class ZKPTradeIntegrity:
         """
         Recompute all hashes to verify chain has not been tampered with.
         """
-        for i in range(1, len(self.chain)):
-            current = self.chain[i]
-            prev = self.chain[i - 1]
-            if current.prev_hash != prev.hash:
-                return False
-            if current.hash != current._compute_hash():
-                return False
-        return True
+        chain = self.chain
+        # Link comparisons are plain string checks; run them over the whole
+        # chain before paying for any re-hashing.
+        if any(cur.prev_hash != prev.hash for prev, cur in pairwise(chain)):
+            return False
+        return all(entry.hash == entry._compute_hash() for entry in islice(chain, 1, None))
 
 
 integrity_ledger = ZKPTradeIntegrity()
@@ -1,8 +1,21 @@
-from dataclasses import dataclass
-from typing import Literal
+import string
+from dataclasses import dataclass, field
+from typing import Any, Literal
 
+# Built once; str.translate applies it in a single C-level pass.
+_STRIP_PUNCTUATION = str.maketrans("", "", string.punctuation)
 
-@dataclass
+
+def _normalize(description: str) -> str:
+    """Normalize a market description for cross-platform matching.
+
+    Lowercases, drops punctuation and collapses whitespace, so "Fed rate
+    hike?" and "fed  rate hike" produce the same key.
+    """
+    return " ".join(description.lower().translate(_STRIP_PUNCTUATION).split())
+
+
+@dataclass(slots=True)
 class PredictionMarket:
     market_id: str
     description: str
@@ -10,6 +23,29 @@ class PredictionMarket:
     no_price: float
     platform: Literal["polymarket", "kalshi"]
     volume: float
+    match_key: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.match_key = _normalize(self.description)
+
+    @classmethod
+    def from_raw(
+        cls, m: dict[str, Any], platform: Literal["polymarket", "kalshi"]
+    ) -> "PredictionMarket":
+        """Build a market from a raw adapter row without the generated __init__.
+
+        Normalization of the description is fused into construction so the
+        arbitrage scan never has to recompute it per pair.
+        """
+        self = cls.__new__(cls)
+        self.market_id = m["market_id"]
+        self.description = m["description"]
+        self.yes_price = m["yes_price"]
+        self.no_price = m["no_price"]
+        self.platform = platform
+        self.volume = m.get("volume", 0)
+        self.match_key = _normalize(self.description)
+        return self
 
     def implied_probability(self) -> float:
         return self.yes_price
@@ -22,35 +58,24 @@ class PredictionMarket:
         - Reverse: BUY NO on self, BUY YES on other
         Returns the better opportunity if either exists.
         """
-        opportunities = []
-
-        # Forward: YES self + NO other
         forward_cost = self.yes_price + other.no_price
-        if forward_cost < 1.0:
-            forward_profit = 1.0 - forward_cost
-            opportunities.append(
-                {
-                    "cost": forward_cost,
-                    "profit": forward_profit,
-                    "roi": forward_profit / forward_cost,
-                    "strategy": f"BUY YES on {self.platform}, BUY NO on {other.platform}",
-                }
-            )
-
-        # Reverse: NO self + YES other
         reverse_cost = self.no_price + other.yes_price
-        if reverse_cost < 1.0:
-            reverse_profit = 1.0 - reverse_cost
-            opportunities.append(
-                {
-                    "cost": reverse_cost,
-                    "profit": reverse_profit,
-                    "roi": reverse_profit / reverse_cost,
-                    "strategy": f"BUY NO on {self.platform}, BUY YES on {other.platform}",
-                }
-            )
-
-        if not opportunities:
+
+        # ROI falls as cost rises, so the cheaper leg is the better one; most
+        # pairs have no edge and return here without building a result.
+        forward = forward_cost <= reverse_cost
+        cost = forward_cost if forward else reverse_cost
+        if cost >= 1.0:
             return None
 
-        return max(opportunities, key=lambda x: x["roi"])
+        if forward:
+            strategy = f"BUY YES on {self.platform}, BUY NO on {other.platform}"
+        else:
+            strategy = f"BUY NO on {self.platform}, BUY YES on {other.platform}"
+        profit = 1.0 - cost
+        return {
+            "cost": cost,
+            "profit": profit,
+            "roi": profit / cost,
+            "strategy": strategy,
+        }
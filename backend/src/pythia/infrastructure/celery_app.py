@@ -1,19 +1,24 @@
 """Celery application configuration for Pythia v4.0.
 
 Defines the Celery app, task autodiscovery, and beat schedule.
-Broker: Redis 7.x. Result backend: Redis.
+Broker: Redis 7.x. Result backend: Redis. Serialization: msgpack.
 """
 
+import asyncio
 import logging
 import os
 
 from celery import Celery
+from celery.signals import worker_process_init
 
 logger = logging.getLogger(__name__)
 
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND", "redis://localhost:6379/1")
 
+# The PM scan reschedules itself adaptively; Beat only restarts a dead chain.
+SCAN_MAX_INTERVAL = 600.0
+
 app = Celery(
     "pythia",
     broker=REDIS_URL,
@@ -21,9 +26,12 @@ app = Celery(
 )
 
 app.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    # msgpack keeps arbitrage payloads compact (binary floats, no quoting);
+    # JSON is still accepted so messages queued before a deploy drain cleanly.
+    task_serializer="msgpack",
+    accept_content=["msgpack", "json"],
+    result_serializer="msgpack",
+    result_accept_content=["msgpack", "json"],
     timezone="UTC",
     enable_utc=True,
     task_track_started=True,
@@ -42,12 +50,26 @@ app.conf.update(
         "pythia.infrastructure.tasks.generate_ai_signal": {"queue": "ai_signals"},
     },
     beat_schedule={
-        "pm-arbitrage-scan-5min": {
+        "pm-arbitrage-scan-watchdog": {
             "task": "pythia.infrastructure.tasks.scan_prediction_markets",
-            "schedule": 300.0,  # every 5 minutes
+            "schedule": SCAN_MAX_INTERVAL,
             "options": {"queue": "pm_scanner"},
         },
     },
 )
 
 app.autodiscover_tasks(["pythia.infrastructure"])
+
+
+@worker_process_init.connect
+def _install_uvloop(**_kwargs):
+    """Run the tasks' asyncio.run loops on libuv when uvloop is installed.
+
+    uvloop ships with uvicorn[standard]; without it the stock loop is kept.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        logger.info("uvloop not available, using the default asyncio event loop")
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
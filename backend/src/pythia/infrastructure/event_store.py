@@ -88,6 +88,60 @@ class EventStore:
         finally:
             db.close()
 
+    def append_batch(
+        self,
+        stream_id: str,
+        events: list[tuple[str, dict[str, Any]]],
+        expected_version: int | None = None,
+    ) -> list[EventLog]:
+        """
+        Append several events to the stream in one transaction.
+
+        The events take consecutive versions after the stream's current
+        version. With expected_version (0 for an empty stream) the current
+        version must match it, otherwise a ValueError is raised.
+        """
+        if not events:
+            return []
+        db = self.session_factory()
+        try:
+            last_event = (
+                db.query(EventLog)
+                .filter(EventLog.stream_id == stream_id)
+                .order_by(EventLog.id.desc())
+                .first()
+            )
+            current_version = last_event.version if last_event else 0
+            if expected_version is not None and current_version != expected_version:
+                raise ValueError(
+                    f"Concurrency conflict: Expected v{expected_version}, found v{current_version}"  # noqa: E501
+                )
+            versions = range(current_version + 1, current_version + 1 + len(events))
+            new_events = [
+                EventLog(
+                    stream_id=stream_id, event_type=event_type, data=data, version=version
+                )
+                for (event_type, data), version in zip(events, versions, strict=True)
+            ]
+            db.add_all(new_events)
+            # The flush sends one batched INSERT and assigns every id, so the
+            # rows are reloaded after commit with a single SELECT instead of
+            # one refresh per event.
+            db.flush()
+            ids = [new_event.id for new_event in new_events]
+            db.commit()
+            return (
+                db.query(EventLog)
+                .filter(EventLog.id.in_(ids))
+                .order_by(EventLog.id.asc())
+                .all()
+            )
+        except Exception as e:
+            db.rollback()
+            raise e
+        finally:
+            db.close()
+
     def get_stream(self, stream_id: str) -> list[EventLog]:
         """
         Read all events for a given stream.
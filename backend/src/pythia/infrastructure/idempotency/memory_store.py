@@ -9,10 +9,12 @@ class InMemoryIdempotencyStore:
     def __init__(self, ttl_seconds: int = 3600):
         self._store: dict[str, dict] = {}
         self.ttl = ttl_seconds
+        # Clock used for TTL checks; tests swap in a virtual clock.
+        self._now = time.time
 
     async def check_and_set(self, key: str, payload: dict) -> bool:
         """Controlla se esiste e non è scaduto, altrimenti salva."""
-        now = time.time()
+        now = self._now()
 
         # Pulizia lazy delle chiavi scadute
         expired_keys = [
@@ -27,6 +29,10 @@ class InMemoryIdempotencyStore:
         self._store[key] = {"payload": payload, "timestamp": now}
         return True
 
+    def clear(self) -> None:
+        """Rimuove tutte le chiavi registrate."""
+        self._store.clear()
+
 
 class IdempotencyLayer:
     """Idempotency layer ensuring operations execute at most once per key."""
@@ -4,10 +4,16 @@ Idempotency checking tramite Redis.
 
 import hashlib
 import json
+from functools import lru_cache
 
 import redis.asyncio as redis
 from fastapi import HTTPException, Request
 
+try:
+    import orjson
+except ImportError:  # dipendenza opzionale; si ripiega sul json della stdlib
+    orjson = None
+
 LUA_IDEMPOTENCY_SCRIPT = """
 if redis.call("EXISTS", KEYS[1]) == 1 then
     return 0
@@ -18,6 +24,17 @@ end
 """
 
 
+def _dumps(payload: dict) -> bytes | str:
+    """Serializzazione canonica (chiavi ordinate, senza spazi) del payload."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"))
+
+
+def _loads(data: bytes | str) -> dict:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
 class IdempotencyStore:
     """Implementa uno store di idempotenza usando script Lua in Redis."""
 
@@ -37,7 +54,7 @@ class IdempotencyStore:
             return False
 
         key = f"idem:{idempotency_key}"
-        data = json.dumps(payload)
+        data = _dumps(payload)
 
         result = await self._set_if_not_exists(
             keys=[key], args=[data, self.ttl_seconds]
@@ -49,10 +66,21 @@ class IdempotencyStore:
         key = f"idem:{idempotency_key}"
         val = await self.redis_client.get(key)
         if val:
-            return json.loads(val)
+            return _loads(val)
         return None
 
 
+@lru_cache(maxsize=1)
+def _get_store() -> IdempotencyStore:
+    """Store condiviso: un solo client Redis e script Lua per processo."""
+    return IdempotencyStore()
+
+
+def _body_fingerprint(body: bytes) -> str:
+    """Impronta compatta del body; BLAKE2b è più rapido di SHA-256 su input brevi."""
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
 async def idempotency_middleware(request: Request, call_next):
     """Middleware FastAPI per forzare X-Idempotency-Key sulle API di trade."""
     if request.method == "POST" and "/api/trades" in request.url.path:
@@ -62,11 +90,10 @@ async def idempotency_middleware(request: Request, call_next):
                 status_code=400, detail="X-Idempotency-Key header is required"
             )
 
-        store = IdempotencyStore()
         body = await request.body()
-        payload = {"body_hash": hashlib.sha256(body).hexdigest()}
+        payload = {"body_hash": _body_fingerprint(body)}
 
-        is_new = await store.check_and_set(idem_key, payload)
+        is_new = await _get_store().check_and_set(idem_key, payload)
         if not is_new:
             raise HTTPException(
                 status_code=409, detail="Idempotent request previously completed"
@@ -191,17 +191,7 @@ class PythiaSupervisor:
                 logger.debug("[ORCHESTRATOR] Scanning prediction markets...")
 
                 kalshi_raw = await adapter.fetch_markets(limit=50, platform="kalshi")
-                kalshi_markets = [
-                    PredictionMarket(
-                        market_id=m["market_id"],
-                        description=m["description"],
-                        yes_price=m["yes_price"],
-                        no_price=m["no_price"],
-                        platform="kalshi",
-                        volume=m.get("volume", 0),
-                    )
-                    for m in kalshi_raw
-                ]
+                kalshi_markets = [PredictionMarket.from_raw(m, "kalshi") for m in kalshi_raw]
                 self.metrics.record_markets_scanned("kalshi", len(kalshi_markets))
 
                 poly_markets = []
@@ -209,17 +199,7 @@ class PythiaSupervisor:
                     poly_raw = await adapter.fetch_markets(
                         limit=50, platform="polymarket"
                     )
-                    poly_markets = [
-                        PredictionMarket(
-                            market_id=m["market_id"],
-                            description=m["description"],
-                            yes_price=m["yes_price"],
-                            no_price=m["no_price"],
-                            platform="polymarket",
-                            volume=m.get("volume", 0),
-                        )
-                        for m in poly_raw
-                    ]
+                    poly_markets = [PredictionMarket.from_raw(m, "polymarket") for m in poly_raw]
                     self.metrics.record_markets_scanned("polymarket", len(poly_markets))
 
                 if poly_markets:
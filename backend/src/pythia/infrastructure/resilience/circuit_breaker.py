@@ -72,12 +72,14 @@ class CircuitBreaker:
         self._failure_count = 0
         self._success_count = 0
         self._last_failure_time = 0.0
+        # Clock used for the recovery window; tests swap in a virtual clock.
+        self._now = time.monotonic
 
     @property
     def state(self) -> CircuitState:
         """Current state, transitioning OPEN -> HALF_OPEN after timeout."""
         if self._state == CircuitState.OPEN:
-            elapsed = time.monotonic() - self._last_failure_time
+            elapsed = self._now() - self._last_failure_time
             if elapsed >= self.config.recovery_timeout:
                 self._state = CircuitState.HALF_OPEN
                 self._success_count = 0
@@ -104,7 +106,7 @@ class CircuitBreaker:
         if self.state == CircuitState.OPEN:
             retry_after = (
                 self.config.recovery_timeout
-                - (time.monotonic() - self._last_failure_time)
+                - (self._now() - self._last_failure_time)
             )
             raise CircuitBreakerOpenError(self.name, max(0.0, retry_after))
 
@@ -114,7 +116,7 @@ class CircuitBreaker:
             return
 
         self._failure_count += 1
-        self._last_failure_time = time.monotonic()
+        self._last_failure_time = self._now()
 
         if self._state == CircuitState.HALF_OPEN:
             self._state = CircuitState.OPEN
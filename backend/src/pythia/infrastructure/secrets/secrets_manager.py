@@ -1,6 +1,7 @@
 import json
 import logging
 import os
+from functools import lru_cache
 from pathlib import Path
 
 from cryptography.fernet import Fernet
@@ -14,6 +15,17 @@ logger = logging.getLogger(__name__)
 # Use SecretsManager to inject parameters at runtime to os.environ.
 
 
+@lru_cache(maxsize=8)
+def _load_cipher(key: bytes) -> Fernet:
+    return Fernet(key)
+
+
+@lru_cache(maxsize=8)
+def _read_key_file(path: Path, mtime_ns: int) -> bytes:
+    # mtime_ns is part of the cache key so a rotated key file is re-read.
+    return path.read_bytes()
+
+
 class SecretsManager:
     """Fernet-based secrets manager with encryption at rest.
 
@@ -25,11 +37,17 @@ class SecretsManager:
         self,
         encryption_key_path: Path = Path(".encryption_key"),
         allow_key_generation: bool = False,
+        encryption_key: bytes | None = None,
     ):
+        # 0. Explicit in-memory key (e.g. ephemeral keys for health probes)
+        if encryption_key is not None:
+            self.cipher = _load_cipher(encryption_key)
+            return
+
         # 1. Prioritize secure memory injection via ENV
         master_key_env = os.getenv("PYTHIA_MASTER_KEY")
         if master_key_env:
-            self.cipher = Fernet(master_key_env.encode())
+            self.cipher = _load_cipher(master_key_env.encode())
             return
             
         # 2. Fallback to disk (for dev/local testing)
@@ -47,7 +65,8 @@ class SecretsManager:
                     f"Encryption key not found (no PYTHIA_MASTER_KEY env, and no file at {encryption_key_path})."
                 )
 
-        self.cipher = Fernet(encryption_key_path.read_bytes())
+        key = _read_key_file(encryption_key_path, encryption_key_path.stat().st_mtime_ns)
+        self.cipher = _load_cipher(key)
 
     def encrypt_secret(self, plaintext: str) -> str:
         return self.cipher.encrypt(plaintext.encode()).decode()
@@ -4,67 +4,209 @@ Each task runs in a separate Celery worker process, enabling
 horizontal scaling and fault isolation.
 """
 
+import asyncio
 import logging
 import os
+import uuid
+from functools import lru_cache
 
-from pythia.infrastructure.celery_app import app
+import redis
+from pythia.adapters.alpaca_adapter import AlpacaAdapter
+from pythia.adapters.pmxt_adapter import PmxtAdapter, PmxtRateLimitError
+from pythia.application.ai_providers.groq_client import GroqClient
+from pythia.application.trading.arbitrage_detector import (
+    ArbitrageDetector,
+    ArbitrageOpportunity,
+)
+from pythia.domain.markets.prediction_market import PredictionMarket
+from pythia.infrastructure.celery_app import REDIS_URL, SCAN_MAX_INTERVAL, app
 
 logger = logging.getLogger(__name__)
 
+SCAN_BASE_INTERVAL = 300.0
+SCAN_MIN_INTERVAL = 60.0
+SCAN_SOFT_TIME_LIMIT = 280
+SCAN_TIME_LIMIT = 300
+SCAN_RETRY_DELAY = 30
+# Slack for a due retry or chained scan waiting in the pm_scanner queue
+# behind other work, and for clock skew between workers and Redis.
+SCAN_LEASE_SLACK = 60
+# One attempt may run for the task's time_limit and then wait
+# default_retry_delay before its retry renews the lease.
+SCAN_ATTEMPT_LEASE = SCAN_TIME_LIMIT + SCAN_RETRY_DELAY + SCAN_LEASE_SLACK
+_SCAN_LEASE_KEY = "pythia:pm_scan:lease"
+_SCAN_RATE_KEY = "pythia:pm_scan:opportunity_rate"
+
+# Extend the lease only if it still holds the caller's token.
+_RENEW_LEASE_LUA = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("expire", KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
+class _ScanCadence:
+    """Derive the next scan delay from recent opportunity density.
+
+    An EWMA of opportunities per scan shortens the delay while arbitrage is
+    showing up (one per scan keeps the 5 minute base) and stretches it
+    towards the maximum when markets are quiet. The EWMA itself lives in
+    Redis, so every worker process adapts the same chain.
+    """
+
+    def __init__(self, smoothing: float = 0.3):
+        self.smoothing = smoothing
+
+    def update(self, opportunity_rate: float, opportunity_count: int) -> float:
+        return opportunity_rate + self.smoothing * (opportunity_count - opportunity_rate)
+
+    def interval(self, opportunity_rate: float) -> float:
+        quiet_rate = SCAN_BASE_INTERVAL / SCAN_MAX_INTERVAL
+        interval = SCAN_BASE_INTERVAL / max(quiet_rate, opportunity_rate)
+        return max(SCAN_MIN_INTERVAL, interval)
+
+
+_SCAN_CADENCE = _ScanCadence()
+
+
+@lru_cache(maxsize=1)
+def _get_redis():
+    return redis.Redis.from_url(REDIS_URL, socket_timeout=2)
+
+
+def _claim_scan_chain(chain_token: str | None) -> str | None:
+    """Return the token this run scans under, or None if another chain owns it.
+
+    The Beat watchdog (no token) only starts a chain by creating the lease,
+    so it never runs next to a live chain, whether that chain is queued,
+    running or retrying. Chained runs continue only while the lease still
+    holds their own token; a chain that lost it exits instead of forking.
+    """
+    r = _get_redis()
+    if chain_token is None:
+        token = uuid.uuid4().hex
+        if r.set(_SCAN_LEASE_KEY, token, nx=True, ex=SCAN_ATTEMPT_LEASE):
+            return token
+        return None
+    if r.eval(_RENEW_LEASE_LUA, 1, _SCAN_LEASE_KEY, chain_token, SCAN_ATTEMPT_LEASE):
+        return chain_token
+    return None
+
+
+def _chain_scan(task, chain_token: str | None, interval: float) -> float | None:
+    """Queue the chain's next scan; None when this run does not own the chain."""
+    if chain_token is None:
+        return None
+    try:
+        # Hold the lease across the countdown and the next run's first attempt.
+        renewed = _get_redis().eval(
+            _RENEW_LEASE_LUA,
+            1,
+            _SCAN_LEASE_KEY,
+            chain_token,
+            int(interval) + SCAN_ATTEMPT_LEASE,
+        )
+    except redis.RedisError as exc:
+        logger.warning("Could not schedule next scan: %s", exc)
+        return None
+    if not renewed:
+        return None
+    task.apply_async(kwargs={"chain_token": chain_token}, countdown=interval)
+    return interval
+
+
+def _schedule_next_scan(task, chain_token: str | None, opportunity_count: int) -> float | None:
+    """Queue the chain's next scan at the cadence set by opportunity density."""
+    if chain_token is None:
+        return None
+    r = _get_redis()
+    try:
+        rate = _SCAN_CADENCE.update(float(r.get(_SCAN_RATE_KEY) or 0.0), opportunity_count)
+        r.set(_SCAN_RATE_KEY, rate)
+    except redis.RedisError as exc:
+        logger.warning("Could not schedule next scan: %s", exc)
+        return None
+    return _chain_scan(task, chain_token, _SCAN_CADENCE.interval(rate))
+
+
+@lru_cache(maxsize=1)
+def _get_pmxt_adapter(
+    kalshi_api_key: str | None,
+    kalshi_private_key_path: str | None,
+    polymarket_wallet_key: str | None,
+):
+    """Build the PMXT adapter once per worker for a given set of credentials.
+
+    Keyed on the credential values, so rotated env vars yield a fresh adapter.
+    """
+    return PmxtAdapter(
+        kalshi_api_key=kalshi_api_key,
+        kalshi_private_key_path=kalshi_private_key_path,
+        polymarket_wallet_key=polymarket_wallet_key,
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_alpaca_adapter(api_key: str, secret_key: str):
+    """Build the Alpaca adapter once per worker for a given set of credentials."""
+    return AlpacaAdapter(api_key=api_key, secret_key=secret_key)
+
+
+async def _fetch_markets(adapter, fetch_polymarket: bool) -> tuple[list, list]:
+    """Fetch Kalshi and (optionally) Polymarket markets concurrently."""
+    kalshi = adapter.fetch_markets(limit=50, platform="kalshi")
+    if not fetch_polymarket:
+        return await kalshi, []
+    kalshi_raw, poly_raw = await asyncio.gather(
+        kalshi, adapter.fetch_markets(limit=50, platform="polymarket")
+    )
+    return kalshi_raw, poly_raw
+
 
 @app.task(
     bind=True,
     name="pythia.infrastructure.tasks.scan_prediction_markets",
     max_retries=3,
-    default_retry_delay=30,
-    soft_time_limit=280,
-    time_limit=300,
+    default_retry_delay=SCAN_RETRY_DELAY,
+    soft_time_limit=SCAN_SOFT_TIME_LIMIT,
+    time_limit=SCAN_TIME_LIMIT,
 )
-def scan_prediction_markets(self):
+def scan_prediction_markets(self, chain_token: str | None = None):
     """Scan Kalshi + Polymarket for cross-platform arbitrage.
 
-    Runs every 5 minutes via Celery Beat.
+    Reschedules itself with a delay between 1 and 10 minutes that shrinks
+    while opportunities keep appearing. A Redis lease names the one live
+    chain; Celery Beat only starts a new chain once that lease has expired
+    (e.g. after the chain exhausted its retries).
     Circuit breaker protects against API failures.
     """
-    from pythia.adapters.pmxt_adapter import PmxtAdapter
-    from pythia.application.trading.arbitrage_detector import ArbitrageDetector
-    from pythia.domain.markets.prediction_market import PredictionMarket
+    try:
+        token = _claim_scan_chain(chain_token)
+    except redis.RedisError as exc:
+        # No chain can be owned without the lease; Beat keeps scanning at the
+        # maximum interval until Redis is back.
+        logger.warning("Could not claim scan lease: %s", exc)
+        if chain_token is not None:
+            return {"skipped": True}
+        token = None
+    else:
+        if token is None:
+            return {"skipped": True}
 
     try:
-        adapter = PmxtAdapter(
-            kalshi_api_key=os.getenv("KALSHI_API_KEY"),
-            kalshi_private_key_path=os.getenv("KALSHI_PRIVATE_KEY_PATH"),
-            polymarket_wallet_key=os.getenv("POLYMARKET_WALLET_KEY"),
+        polymarket_wallet_key = os.getenv("POLYMARKET_WALLET_KEY")
+        adapter = _get_pmxt_adapter(
+            os.getenv("KALSHI_API_KEY"),
+            os.getenv("KALSHI_PRIVATE_KEY_PATH"),
+            polymarket_wallet_key,
         )
         detector = ArbitrageDetector(min_roi=0.015)
 
-        kalshi_raw = adapter.fetch_markets("kalshi", limit=50)
-        kalshi_markets = [
-            PredictionMarket(
-                market_id=m["market_id"],
-                description=m["description"],
-                yes_price=m["yes_price"],
-                no_price=m["no_price"],
-                platform="kalshi",
-                volume=m.get("volume", 0),
-            )
-            for m in kalshi_raw
-        ]
-
-        poly_markets = []
-        if os.getenv("POLYMARKET_WALLET_KEY"):
-            poly_raw = adapter.fetch_markets("polymarket", limit=50)
-            poly_markets = [
-                PredictionMarket(
-                    market_id=m["market_id"],
-                    description=m["description"],
-                    yes_price=m["yes_price"],
-                    no_price=m["no_price"],
-                    platform="polymarket",
-                    volume=m.get("volume", 0),
-                )
-                for m in poly_raw
-            ]
+        fetch_polymarket = bool(polymarket_wallet_key)
+        kalshi_raw, poly_raw = asyncio.run(_fetch_markets(adapter, fetch_polymarket))
+        kalshi_markets = [PredictionMarket.from_raw(m, "kalshi") for m in kalshi_raw]
+        poly_markets = [PredictionMarket.from_raw(m, "polymarket") for m in poly_raw]
 
         result = {
             "kalshi_scanned": len(kalshi_markets),
@@ -75,16 +217,23 @@ def scan_prediction_markets(self):
         if poly_markets:
             opportunities = detector.find_opportunities(kalshi_markets, poly_markets)
             result["opportunities"] = [
-                {"roi": o["roi"], "strategy": o["strategy"]} for o in opportunities
+                ArbitrageOpportunity(o["roi"], o["strategy"]) for o in opportunities
             ]
             if opportunities:
                 logger.info("Found %d arbitrage opportunities", len(opportunities))
 
+        result["next_scan_in"] = _schedule_next_scan(self, token, len(result["opportunities"]))
         return result
 
+    except PmxtRateLimitError as exc:
+        # A retry after default_retry_delay would hit the same throttle; skip
+        # to the slowest chain slot instead of spending retries on HTTP 429s.
+        logger.warning("PM scan rate limited: %s", exc)
+        return {"rate_limited": True, "next_scan_in": _chain_scan(self, token, SCAN_MAX_INTERVAL)}
+
     except Exception as exc:
         logger.error("PM scan failed: %s", exc)
-        raise self.retry(exc=exc) from exc
+        raise self.retry(exc=exc, kwargs={"chain_token": token}) from exc
 
 
 @app.task(
@@ -107,23 +256,17 @@ def execute_multi_asset_trade(
         logger.info("Executing %s %s %s qty=%.2f", asset_class, side, symbol, quantity)
 
         if asset_class == "stocks":
-            from pythia.adapters.alpaca_adapter import AlpacaAdapter
-
-            adapter = AlpacaAdapter(
-                api_key=os.getenv("ALPACA_API_KEY", ""),
-                secret_key=os.getenv("ALPACA_SECRET_KEY", ""),
+            adapter = _get_alpaca_adapter(
+                os.getenv("ALPACA_API_KEY", ""), os.getenv("ALPACA_SECRET_KEY", "")
             )
-            import asyncio
-
             result = asyncio.run(adapter.place_order(symbol, quantity, side))
             return {"status": "executed", "platform": "alpaca", "result": str(result)}
 
         if asset_class == "prediction_markets":
-            from pythia.adapters.pmxt_adapter import PmxtAdapter
-
-            adapter = PmxtAdapter(
-                kalshi_api_key=os.getenv("KALSHI_API_KEY"),
-                kalshi_private_key_path=os.getenv("KALSHI_PRIVATE_KEY_PATH"),
+            adapter = _get_pmxt_adapter(
+                os.getenv("KALSHI_API_KEY"),
+                os.getenv("KALSHI_PRIVATE_KEY_PATH"),
+                os.getenv("POLYMARKET_WALLET_KEY"),
             )
             result = adapter.place_order("kalshi", symbol, side, quantity, 0.0)
             return {"status": "executed", "platform": "kalshi", "result": str(result)}
@@ -147,10 +290,6 @@ def generate_ai_signal(pair: str, price: float, indicators: dict):
     to the event bus for downstream consumption.
     """
     try:
-        import asyncio
-
-        from pythia.application.ai_providers.groq_client import GroqClient
-
         client = GroqClient()
         signal = asyncio.run(
             client.get_signal(
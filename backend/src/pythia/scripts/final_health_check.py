@@ -1,55 +1,89 @@
 import os
 import subprocess
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Set PYTHONPATH to include the source directory
 os.environ["PYTHONPATH"] = str(Path("backend/src").absolute())
 
+CRITICAL_FILES = [
+    "backend/src/pythia/adapters/pmxt_adapter.py",
+    "backend/src/pythia/domain/markets/prediction_market.py",
+    "backend/src/pythia/application/trading/arbitrage_detector.py",
+    "backend/src/pythia/infrastructure/secrets/secrets_manager.py",
+    "backend/src/pythia/infrastructure/rate_limiting/circuit_breaker.py",
+    "backend/src/pythia/infrastructure/monitoring/prometheus_exporter.py",
+    "docker-compose.prod.yml",
+    "k8s/pythia-deployment.yaml",
+    "docs/adr/0001-prediction-markets-integration.md",
+]
 
-def check_file_structure():
-    print("\n📁 VERIFYING FILE STRUCTURE...")
-    critical_files = [
-        "backend/src/pythia/adapters/pmxt_adapter.py",
-        "backend/src/pythia/domain/markets/prediction_market.py",
-        "backend/src/pythia/application/trading/arbitrage_detector.py",
-        "backend/src/pythia/infrastructure/secrets/secrets_manager.py",
-        "backend/src/pythia/infrastructure/rate_limiting/circuit_breaker.py",
-        "backend/src/pythia/infrastructure/monitoring/prometheus_exporter.py",
-        "docker-compose.prod.yml",
-        "k8s/pythia-deployment.yaml",
-        "docs/adr/0001-prediction-markets-integration.md",
-    ]
 
-    missing = []
-    for f in critical_files:
+def _list_dir(parent: str) -> set[str]:
+    try:
+        with os.scandir(parent) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
+
+def check_file_structure() -> tuple[bool, list[str]]:
+    lines = ["\n📁 VERIFYING FILE STRUCTURE..."]
+
+    # One directory listing per parent instead of one stat per file.
+    by_parent = defaultdict(list)
+    for f in CRITICAL_FILES:
         path = Path(f)
-        exists = path.exists()
-        print(f"  {'✅' if exists else '❌'} {f}")
+        by_parent[str(path.parent)].append((f, path.name))
+    present = set()
+    for parent, files in by_parent.items():
+        names = _list_dir(parent)
+        present.update(f for f, name in files if name in names)
+
+    missing = []
+    for f in CRITICAL_FILES:
+        exists = f in present
+        lines.append(f"  {'✅' if exists else '❌'} {f}")
         if not exists:
             missing.append(f)
-    return len(missing) == 0
+    return len(missing) == 0, lines
 
 
-def check_git_status():
-    print("\n📦 VERIFYING GIT STATUS...")
+def start_git_status() -> subprocess.Popen | None:
+    """Launch `git status` up front so it runs alongside the other checks."""
     try:
-        result = subprocess.run(
-            ["git", "status", "--short"], capture_output=True, text=True  # noqa: S607
+        return subprocess.Popen(
+            ["git", "status", "--short"],  # noqa: S607
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
         )
-        uncommitted = result.stdout.strip()
+    except OSError:
+        return None
+
+
+def check_git_status(proc: subprocess.Popen | None) -> tuple[bool, list[str]]:
+    lines = ["\n📦 VERIFYING GIT STATUS..."]
+    try:
+        if proc is None:
+            raise RuntimeError("git is not available")
+        stdout, _ = proc.communicate()
+        uncommitted = stdout.strip()
         if uncommitted:
-            print(f"  ⚠️ Working directory dirty:\n{uncommitted}")
+            lines.append(f"  ⚠️ Working directory dirty:\n{uncommitted}")
         else:
-            print("  ✅ Working directory clean")
-        return True
+            lines.append("  ✅ Working directory clean")
+        return True, lines
     except Exception as e:
-        print(f"  ❌ Git check failed: {e}")
-        return False
+        lines.append(f"  ❌ Git check failed: {e}")
+        return False, lines
 
 
-def check_logic():
-    print("\n🧪 VERIFYING DOMAIN LOGIC...")
+def check_logic() -> tuple[bool, list[str]]:
+    lines = ["\n🧪 VERIFYING DOMAIN LOGIC..."]
     try:
+        from cryptography.fernet import Fernet
         from pythia.domain.markets.prediction_market import PredictionMarket
         from pythia.infrastructure.secrets.secrets_manager import SecretsManager
 
@@ -58,19 +92,18 @@ def check_logic():
         m2 = PredictionMarket("P1", "Test", 0.55, 0.44, "polymarket", 100)
         arb = m1.arbitrage_opportunity(m2)
         assert arb is not None and arb["profit"] > 0
-        print("  ✅ Domain: Arbitrage detection logic works")
+        lines.append("  ✅ Domain: Arbitrage detection logic works")
 
-        # Test 2: Secrets Encryption
-        mgr = SecretsManager(encryption_key_path=Path(".encryption_key_health"))
+        # Test 2: Secrets Encryption (ephemeral in-memory key, no disk I/O)
+        mgr = SecretsManager(encryption_key=Fernet.generate_key())
         token = mgr.encrypt_secret("pythia_test")
         assert mgr.decrypt_secret(token) == "pythia_test"
-        Path(".encryption_key_health").unlink()
-        print("  ✅ Infrastructure: Secrets encryption works")
+        lines.append("  ✅ Infrastructure: Secrets encryption works")
 
-        return True
+        return True, lines
     except Exception as e:
-        print(f"  ❌ Logic check failed: {e}")
-        return False
+        lines.append(f"  ❌ Logic check failed: {e}")
+        return False, lines
 
 
 def run_health_check():
@@ -78,9 +111,17 @@ def run_health_check():
     print("🚀 PYTHIA MULTI-ASSET READINESS REPORT")
     print("=" * 60)
 
-    s1 = check_file_structure()
-    _s2 = check_git_status()
-    s3 = check_logic()
+    git_proc = start_git_status()
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        files = pool.submit(check_file_structure)
+        git = pool.submit(check_git_status, git_proc)
+        logic = pool.submit(check_logic)
+        results = [files.result(), git.result(), logic.result()]
+
+    # Checks run concurrently; their output is printed in a fixed order.
+    for _, lines in results:
+        print("\n".join(lines))
+    (s1, _), (_s2, _), (s3, _) = results
 
     print("\n" + "=" * 60)
     if s1 and s3:
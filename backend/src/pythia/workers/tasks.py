@@ -74,6 +74,5 @@ def evaluate_market_task(market_id: str, question_title: str, outcomes: list[dic
             logger.info("Holding market, no intent published", market_id=market_id)
 
     # Execute async core
-    loop = asyncio.get_event_loop()
-    loop.run_until_complete(_run_evaluation())
+    asyncio.run(_run_evaluation())
     return True
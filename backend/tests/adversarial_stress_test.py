@@ -1,10 +1,11 @@
 import asyncio
-import json
+import itertools
 import logging
 import os
 import sys
 import time
 
+import orjson
 import zmq
 from zmq.asyncio import Context
 
@@ -24,7 +25,8 @@ async def stress_test_bus():
     Simulates a 'Red Team' DDoS attack on the internal bus
     to verify stability and throughput.
     """
-    ctx = Context()
+    # Process-wide context: repeated runs reuse it instead of building a new one.
+    ctx = Context.instance()
 
     # 1. Connect as a Strategy Subscriber (Listening to Execution Pub)
     # Note: Execution Pub binds to 5555. We sub to localhost:5555.
@@ -37,44 +39,62 @@ async def stress_test_bus():
     # connecting to the Execution Service.
     # Actually, let's test the 'Data' endpoint (REP/REQ) for latency.
 
-    # Data Layer binds REP on 5557. We will be a REQ client.
-    req_socket = ctx.socket(zmq.REQ)
+    # Data Layer binds REP on 5557. A DEALER client keeps every request in
+    # flight at once instead of REQ's send/recv lockstep. REP echoes every
+    # frame before the empty delimiter, so an 8-byte correlation id placed
+    # there comes back with the reply and routes it to its waiting request.
+    req_socket = ctx.socket(zmq.DEALER)
+    req_socket.setsockopt(zmq.IDENTITY, b"stress")
     req_socket.connect("tcp://127.0.0.1:5557")
 
     logger.info("Starting Stress Test on Data Endpoint (Port 5557)...")
 
-    failures = 0
-    successes = 0
-    start_time = time.time()
+    loop = asyncio.get_running_loop()
+    pending: dict[int, asyncio.Future] = {}
+    correlation_ids = itertools.count()
 
-    # ATTACK VECTOR: 1000 requests in rapid succession
-    for i in range(100):
-        try:
-            payload = json.dumps({"action": "ping", "id": i})
+    async def reader():
+        while True:
+            cid_frame, _delimiter, reply = await req_socket.recv_multipart()
+            fut = pending.pop(int.from_bytes(cid_frame, "big"), None)
+            if fut is not None and not fut.done():
+                fut.set_result(reply)
 
-            # Send with 1s timeout
-            await req_socket.send_string(payload)
+    async def send_one(i: int) -> bool:
+        cid = next(correlation_ids)
+        fut = pending[cid] = loop.create_future()
+        try:
+            # orjson encodes straight to bytes; no str -> utf-8 round trip.
+            payload = orjson.dumps({"action": "ping", "id": i})
+            await req_socket.send_multipart([cid.to_bytes(8, "big"), b"", payload])
 
             # Receive with 1s timeout
-            if await req_socket.poll(1000):
-                _reply = await req_socket.recv_string()
-                successes += 1
-            else:
-                logger.error(f"Timeout on request {i}")
-                # Reset socket on timeout in ZMQ REQ/REP pattern is complex,
-                # often easier to recreate. marking as fail.
-                failures += 1
-
+            _reply = orjson.loads(await asyncio.wait_for(fut, 1.0))
+            return True
+        except TimeoutError:
+            logger.error(f"Timeout on request {i}")
         except Exception as e:
             logger.error(f"Error on request {i}: {e}")
-            failures += 1
+        finally:
+            pending.pop(cid, None)
+        return False
+
+    reader_task = asyncio.create_task(reader())
+    start_time = time.time()
+
+    # ATTACK VECTOR: 100 requests pipelined concurrently
+    results = await asyncio.gather(*(send_one(i) for i in range(100)))
+    successes = sum(results)
+    failures = len(results) - successes
 
     duration = time.time() - start_time
     logger.info(f"Test Complete in {duration:.2f}s")
     logger.info(f"Success: {successes}, Failures: {failures}")
     logger.info(f"Throughput: {successes / duration:.1f} req/s")
 
-    ctx.term()
+    reader_task.cancel()
+    req_socket.close(linger=0)
+    sub_socket.close(linger=0)
 
 
 if __name__ == "__main__":
@@ -4,51 +4,149 @@ from collections.abc import Generator
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import Connection, Engine, create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
+
+try:
+    import uvloop
+except ImportError:  # POSIX-only; async tests fall back to the stock loop
+    uvloop = None
 
 # Ensure backend root is in path for main.py import
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 # Grouping delayed imports after sys.path modification
 from main import app  # noqa: E402
+from pythia.application.backtest_engine import BacktestEngine  # noqa: E402
+from pythia.application.websocket_manager import ConnectionManager  # noqa: E402
+from pythia.core import auth  # noqa: E402
 from pythia.core.structured_logging import setup_structured_logging  # noqa: E402
 from pythia.infrastructure.persistence.database import get_db  # noqa: E402
 from pythia.infrastructure.persistence.models import Base  # noqa: E402
+from pythia.infrastructure.secrets.secrets_manager import SecretsManager  # noqa: E402
 
 setup_structured_logging("ERROR", "test.log")
 
 pytest_plugins = ("pytest_asyncio",)
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
-)
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("perf", "pedantic benchmark settings")
+    group.addoption("--perf-rounds", type=int, default=100, help="benchmark rounds")
+    group.addoption(
+        "--perf-iterations", type=int, default=1000, help="iterations per benchmark round"
+    )
+
+
+@pytest.fixture(scope="session")
+def perf_settings(pytestconfig: pytest.Config) -> dict[str, int]:
+    """Rounds/iterations for benchmark.pedantic, tunable from the command line."""
+    return {
+        "rounds": pytestconfig.getoption("--perf-rounds"),
+        "iterations": pytestconfig.getoption("--perf-iterations"),
+    }
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_asyncio_loop_factories(config, item):
+    """Run async tests on uvloop when it is installed."""
+    if uvloop is None:
+        return None
+    return {"uvloop": uvloop.new_event_loop}
+
+
+def _configure_sqlite(dbapi_connection, connection_record):
+    # pysqlite's implicit transaction handling breaks SAVEPOINT; let
+    # SQLAlchemy emit BEGIN itself so nested transactions behave like on
+    # Postgres.
+    dbapi_connection.isolation_level = None
+    dbapi_connection.execute("PRAGMA journal_mode=WAL")
+    dbapi_connection.execute("PRAGMA synchronous=NORMAL")
+
+
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
 
-@pytest.fixture(scope="function", autouse=True)
-def setup_test_db():
-    """Create and drop tables for every test to guarantee perfect isolation."""
+
+@pytest.fixture(scope="session")
+def engine(tmp_path_factory: pytest.TempPathFactory) -> Generator[Engine, None, None]:
+    """One SQLite file per pytest-xdist worker, so ``-n auto`` runs in parallel.
+
+    tmp_path_factory already gives each worker its own base directory; the
+    worker id in the file name keeps the databases apart in logs as well.
+    """
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    path = tmp_path_factory.mktemp("db") / f"test-{worker_id}.db"
+    test_engine = create_engine(
+        f"sqlite+pysqlite:///{path}", connect_args={"check_same_thread": False}
+    )
+    event.listen(test_engine, "connect", _configure_sqlite)
+    event.listen(test_engine, "begin", _emit_begin)
+    yield test_engine
+    test_engine.dispose()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def setup_test_db(engine: Engine):
+    """Create the schema once; tests are isolated by transaction rollback."""
     Base.metadata.create_all(bind=engine)
     yield
     Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _fast_password_hashing():
+    """Use bcrypt's minimum cost; tests check correctness, not strength."""
+    rounds = auth.BCRYPT_ROUNDS
+    auth.BCRYPT_ROUNDS = 4
+    yield
+    auth.BCRYPT_ROUNDS = rounds
+
+
+@pytest.fixture(scope="function")
+def db_connection(engine: Engine) -> Generator[Connection, None, None]:
+    """Connection inside an outer transaction that is rolled back after the test.
+
+    Sessions bound to it use join_transaction_mode="create_savepoint", so
+    commits inside the test only release a SAVEPOINT and teardown is a single
+    ROLLBACK instead of dropping and recreating every table.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    yield connection
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(scope="function")
+def db_session_factory(db_connection: Connection) -> sessionmaker:
+    """Session factory for code that opens and closes its own sessions."""
+    return sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=db_connection,
+        join_transaction_mode="create_savepoint",
+    )
+
+
 @pytest.fixture(scope="function", name="db_session")
-def db_session_fixture() -> Generator[Session, None, None]:
-    """Provide a pristine database session."""
-    session = TestingSessionLocal()
+def db_session_fixture(db_session_factory: sessionmaker) -> Generator[Session, None, None]:
+    """Provide a session whose writes are rolled back after the test."""
+    session = db_session_factory()
     yield session
     session.close()
 
 
+@pytest.fixture(scope="session")
+def app_client() -> Generator[TestClient, None, None]:
+    """One TestClient (and app startup) shared by the whole session."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
 @pytest.fixture(scope="function")
-def client(db_session: Session) -> Generator[TestClient, None, None]:
-    """Provide a TestClient with a session-overridden database."""
+def client(app_client: TestClient, db_session: Session) -> Generator[TestClient, None, None]:
+    """Provide the shared TestClient with a session-overridden database."""
 
     def override_get_db():
         try:
@@ -57,6 +155,24 @@ def client(db_session: Session) -> Generator[TestClient, None, None]:
             pass
 
     app.dependency_overrides[get_db] = override_get_db
-    with TestClient(app) as test_client:
-        yield test_client
+    yield app_client
     app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def backtest_engine() -> BacktestEngine:
+    """Fresh backtest engine per test."""
+    return BacktestEngine(initial_balance=10000.0)
+
+
+@pytest.fixture
+def connection_manager() -> ConnectionManager:
+    """Fresh WebSocket connection manager per test."""
+    return ConnectionManager()
+
+
+@pytest.fixture(scope="session")
+def secrets_manager(tmp_path_factory: pytest.TempPathFactory) -> SecretsManager:
+    """One SecretsManager per session, keyed from a private temp directory."""
+    key_path = tmp_path_factory.mktemp("secrets") / ".encryption_key"
+    return SecretsManager(encryption_key_path=key_path, allow_key_generation=True)
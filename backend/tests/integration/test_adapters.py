@@ -9,13 +9,33 @@ import pytest
 from pythia.adapters.alpaca_adapter import AlpacaAdapter, AlpacaAdapterError
 from pythia.adapters.pmxt_adapter import PmxtAdapter
 
+pytestmark = pytest.mark.integration
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def alpaca_mock():
     with patch("pythia.adapters.alpaca_adapter.TradingClient") as MockClient:  # noqa: N806
         yield MockClient
 
 
+@pytest.fixture(scope="module")
+def alpaca_adapter(alpaca_mock):
+    """One adapter per module; construction is identical for every test."""
+    return AlpacaAdapter("test", "test")
+
+
+@pytest.fixture(scope="module")
+def pmxt_adapter():
+    with patch("pythia.adapters.pmxt_adapter.pmxt.Polymarket"):
+        yield PmxtAdapter(polymarket_wallet_key="pkey")
+
+
+@pytest.fixture(autouse=True)
+def _reset_alpaca_mock(alpaca_mock):
+    yield
+    alpaca_mock.reset_mock()
+
+
 def test_alpaca_initialization_assertions(alpaca_mock):
     """Test Pre-condition: cannot initialize Alpaca without keys."""
     with pytest.raises(AssertionError):
@@ -23,9 +43,9 @@ def test_alpaca_initialization_assertions(alpaca_mock):
 
 
 @pytest.mark.asyncio
-async def test_alpaca_pdt_compliance_rule():
+async def test_alpaca_pdt_compliance_rule(alpaca_adapter):
     """Test Neuro-Symbolic logic: PDT rule rejection."""
-    adapter = AlpacaAdapter("test", "test")
+    adapter = alpaca_adapter
     # Rule: Equity < 25000 and daytrades >= 3 triggers violation
     status = {"equity": 24000.0, "daytrade_count": 3}
     assert adapter._check_pdt_compliance(status) is False
@@ -36,10 +56,10 @@ async def test_alpaca_pdt_compliance_rule():
 
 
 @pytest.mark.asyncio
-async def test_alpaca_place_order_market_closed(alpaca_mock):
+async def test_alpaca_place_order_market_closed(alpaca_adapter, monkeypatch):
     """Test Edge Case: Market Closed Rejection."""
-    adapter = AlpacaAdapter("test", "test")
-    adapter.is_market_open = AsyncMock(return_value=False)
+    adapter = alpaca_adapter
+    monkeypatch.setattr(adapter, "is_market_open", AsyncMock(return_value=False))
 
     with pytest.raises(AlpacaAdapterError, match="US Markets closed"):
         await adapter.place_order("AAPL", "BUY", 1.0)
@@ -55,19 +75,16 @@ async def test_pmxt_initialization():
 
 
 @pytest.mark.asyncio
-async def test_pmxt_fetch_markets_validations():
+async def test_pmxt_fetch_markets_validations(pmxt_adapter):
     """Test PmxtAdapter assertions on fetch."""
-    adapter = PmxtAdapter(polymarket_wallet_key="pkey")
-    with patch("pythia.adapters.pmxt_adapter.pmxt.Polymarket"):
-        with pytest.raises(AssertionError):
-            await adapter.fetch_markets(limit=-5, platform="polymarket")
+    with pytest.raises(AssertionError):
+        await pmxt_adapter.fetch_markets(limit=-5, platform="polymarket")
 
 
 @pytest.mark.asyncio
-async def test_pmxt_place_order_missing_price():
+async def test_pmxt_place_order_missing_price(pmxt_adapter):
     """Test Edge Case: PM requires explicit limit price."""
-    adapter = PmxtAdapter(polymarket_wallet_key="pkey")
     with pytest.raises(AssertionError, match="explicit limit pricing"):
-        await adapter.place_order(
+        await pmxt_adapter.place_order(
             "MARKET_ID", "BUY", 10.0, price=None, platform="polymarket"
         )
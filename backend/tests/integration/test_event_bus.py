@@ -9,6 +9,8 @@ import pytest
 from pythia.core.event_bus import EventBusError, RedisEventBus
 from pythia.domain.events.domain_events import TradeExecutedEvent
 
+pytestmark = pytest.mark.integration
+
 
 @pytest.fixture
 def redis_mock():
@@ -11,6 +11,8 @@ from pythia.adapters.pmxt_adapter import PmxtAdapter, PmxtAdapterError
 from pythia.application.trading.arbitrage_detector import ArbitrageDetector
 from pythia.domain.markets.prediction_market import PredictionMarket
 
+pytestmark = pytest.mark.integration
+
 
 class TestPmxtAdapterInitialization:
     """Verify adapter initializes correctly with and without credentials."""
@@ -171,6 +173,29 @@ class TestArbitrageDetector:
         opps = detector.find_opportunities(kalshi, poly)
         assert len(opps) == 0
 
+    def test_scans_full_grid_in_kalshi_major_order(self):
+        detector = ArbitrageDetector(min_roi=0.01)
+        kalshi = [
+            self._make_market("K1", "Bitcoin 100K June", 0.60, 0.45, "kalshi"),
+            self._make_market("K2", "Fed Rate Hike March", 0.42, 0.58, "kalshi"),
+            self._make_market("K3", "ETH Flips BTC 2026", 0.10, 0.85, "kalshi"),
+        ]
+        poly = [
+            self._make_market("P1", "ETH Flips BTC 2026", 0.12, 0.88, "polymarket"),
+            self._make_market("P2", "Fed Rate Hike March", 0.45, 0.53, "polymarket"),
+            self._make_market("P3", "Bitcoin 100K June", 0.55, 0.50, "polymarket"),
+        ]
+        # Only K2/P2 (0.42 + 0.53) and K3/P1 (0.85 + 0.12) are both priced
+        # below 1.0 and matched by description.
+        opps = detector.find_opportunities(kalshi, poly)
+        assert [o["cost"] for o in opps] == [pytest.approx(0.95), pytest.approx(0.97)]
+
+    def test_empty_side_returns_no_opportunities(self):
+        detector = ArbitrageDetector(min_roi=0.01)
+        kalshi = [self._make_market("K1", "Fed Rate Hike March", 0.42, 0.58, "kalshi")]
+        assert detector.find_opportunities(kalshi, []) == []
+        assert detector.find_opportunities([], kalshi) == []
+
 
 class TestPredictionMarketDomainEntity:
     """Verify domain entity logic."""
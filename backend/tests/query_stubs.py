@@ -0,0 +1,24 @@
+"""Session stand-ins for tests that only walk query(...).filter(...).all()."""
+
+
+class StubQuery:
+    """query(...).filter(...).all() chain returning a canned row list."""
+
+    def __init__(self, rows: list):
+        self._rows = rows
+
+    def filter(self, *criteria):
+        return self
+
+    def all(self) -> list:
+        return self._rows
+
+
+class StubSession:
+    """Session whose every query(...) yields the same canned rows."""
+
+    def __init__(self, rows: list):
+        self._rows = rows
+
+    def query(self, *entities) -> StubQuery:
+        return StubQuery(self._rows)
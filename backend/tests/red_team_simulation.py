@@ -16,11 +16,13 @@ Verifies:
 """
 
 import asyncio
+import itertools
 import logging
 import os
-import random
 import sys
 
+import numpy as np
+
 current_dir = os.path.dirname(os.path.abspath(__file__))
 backend_dir = os.path.dirname(current_dir)
 if backend_dir not in sys.path:
@@ -29,6 +31,7 @@ from pythia.core.integrity import integrity_ledger  # noqa: E402
 from pythia.core.neuro_symbolic import neuro_validator  # noqa: E402
 from pythia.infrastructure.resilience.circuit_breaker import (  # noqa: E402
     CircuitBreaker,
+    CircuitBreakerConfig,
     CircuitBreakerOpenError,
 )  # noqa: E402
 
@@ -38,29 +41,51 @@ logging.basicConfig(
 logger = logging.getLogger("RedTeam")
 
 
+# Seeded draws generated in one vectorized call; the run is reproducible,
+# so the assertions below need no retries under bad luck.
+_RNG = np.random.default_rng(42).random(1024)
+_idx = itertools.count()
+
+
+def _draw() -> float:
+    return _RNG[next(_idx) % len(_RNG)]
+
+
 class MockBus:
     async def publish_signal(self, signal):
-        if random.random() < 0.2:  # noqa: S311
+        if _draw() < 0.2:
             raise Exception("Simulated Network Partition")
         return True
 
 
 mock_bus = MockBus()
-cb = CircuitBreaker(failure_threshold=3, recovery_timeout=1)
 
 
-async def attack_vector_validity():
-    """Inject malicious trade signals to test Neuro-Symbolic Validator."""
-    logger.info(">>> ATTACK 1: Malicious Data Injection")
-    attacks = [
+def _new_breaker() -> CircuitBreaker:
+    return CircuitBreaker(
+        "red_team", CircuitBreakerConfig(failure_threshold=3, recovery_timeout=1)
+    )
+
+
+cb = _new_breaker()
+
+# (signal, validator confidence) pairs, built once at import.
+_ATTACK_TABLE = tuple(
+    (attack, 0.9 if attack["symbol"] != "ETH/USD" else 0.5)
+    for attack in (
         {"action": "buy", "symbol": "SCAM", "quantity": 100, "price": 10},
         {"action": "sell", "symbol": "BTC/USD", "quantity": 1000, "price": 50000},
         {"action": "buy", "symbol": "ETH/USD", "quantity": 0.1, "price": -500},
         {"action": "buy", "symbol": "BTC/USD", "quantity": 0.1, "price": 50000},
-    ]
+    )
+)
+
+
+async def attack_vector_validity():
+    """Inject malicious trade signals to test Neuro-Symbolic Validator."""
+    logger.info(">>> ATTACK 1: Malicious Data Injection")
     blocked = 0
-    for attack in attacks:
-        conf = 0.9 if attack["symbol"] != "ETH/USD" else 0.5
+    for attack, conf in _ATTACK_TABLE:
         valid = neuro_validator.validate(attack, confidence=conf)
         if not valid:
             blocked += 1
@@ -74,15 +99,15 @@ async def attack_vector_validity():
     logger.info(">>> ATTACK 1 PASSED: Neuro-Symbolic Defense Active")
 
 
-async def attack_vector_resilience():
+async def attack_vector_resilience(breaker: CircuitBreaker = cb):
     """Flood system with requests to trip Circuit Breaker."""
     logger.info(">>> ATTACK 2: DDOS / Service Degradation")
 
-    @cb
     async def fragile_service():
-        if random.random() < 0.8:  # noqa: S311
-            raise ValueError("Service Overload")
-        return "OK"
+        with breaker:
+            if _draw() < 0.8:
+                raise ValueError("Service Overload")
+            return "OK"
 
     failures = 0
     tripped = False
@@ -126,4 +151,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
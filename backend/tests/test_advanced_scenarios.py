@@ -1,22 +1,71 @@
-import asyncio
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
-from pythia.application.backtest_engine import BacktestEngine
 from pythia.application.market_data import MarketDataService
 from pythia.application.stop_loss_manager import StopLossTakeProfitManager
-from pythia.application.websocket_manager import ConnectionManager
 from pythia.infrastructure.persistence.models import Position
+from query_stubs import StubQuery
 
+FIXED_TS = datetime(2024, 1, 1)
 
-def test_backtest_complex_strategy():
+
+class StubResult:
+    def __init__(self, row):
+        self._row = row
+
+    def scalar_one(self):
+        return self._row
+
+
+class StubDB:
+    """Just enough Session surface for StopLossTakeProfitManager."""
+
+    def __init__(self, query_rows: list[list], execute_rows: list):
+        self._query_rows = iter(query_rows)
+        self._execute_rows = iter(execute_rows)
+        self.added: list = []
+
+    def query(self, *entities) -> StubQuery:
+        return StubQuery(next(self._query_rows))
+
+    def execute(self, statement) -> StubResult:
+        return StubResult(next(self._execute_rows))
+
+    def add(self, obj) -> None:
+        self.added.append(obj)
+
+    def flush(self) -> None:
+        pass
+
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        pass
+
+
+class FakeWS:
+    """Minimal WebSocket stand-in; AsyncMock bookkeeping dwarfs the code under test."""
+
+    def __init__(self):
+        self.sent: list[str] = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, data: str):
+        self.sent.append(data)
+
+
+def test_backtest_complex_strategy(backtest_engine):
     """
     Analista Scenario: Verify state consistency across a complex sequence of trades.
     Sequence: Buy -> Partial Sell -> Buy More -> Sell All.
     """
-    engine = BacktestEngine(initial_balance=10000.0)
-    ts = datetime.now()
+    engine = backtest_engine
+    ts = FIXED_TS
     assert engine.execute_buy(ts, "AAPL", 10, 100.0)
     assert engine.positions["AAPL"] == 10
     assert engine.balance < 10000.0
@@ -32,22 +81,21 @@ def test_backtest_complex_strategy():
 
 
 @pytest.mark.asyncio
-async def test_websocket_concurrency():
+async def test_websocket_concurrency(connection_manager):
     """
     Programmatore Capo Scenario: Stress test connection manager with concurrent operations.
     """
-    manager = ConnectionManager()
+    manager = connection_manager
     num_clients = 50
-    mock_sockets = [AsyncMock() for _ in range(num_clients)]
+    mock_sockets = [FakeWS() for _ in range(num_clients)]
 
-    async def connect_client(ws):
+    # connect() never suspends on a fake socket, so gathering tasks would only
+    # add scheduler overhead; keep gather for code that really awaits I/O.
+    for ws in mock_sockets:
         await manager.connect(ws)
-
-    await asyncio.gather(*[connect_client(ws) for ws in mock_sockets])
     assert len(manager.active_connections) == num_clients
     await manager.broadcast({"type": "stress_test"})
-    for ws in mock_sockets:
-        ws.send_json.assert_called()
+    assert all(len(ws.sent) == 1 for ws in mock_sockets)
     for ws in mock_sockets:
         manager.disconnect(ws)
     assert len(manager.active_connections) == 0
@@ -58,8 +106,6 @@ def test_stop_loss_slippage():
     Analista Scenario: Market opens significantly below stop price (Gap Down).
     The system should execute at the OPEN price (slippage), not the STOP price.
     """
-    mock_db = MagicMock()
-    manager = StopLossTakeProfitManager(mock_db)
     position = Position(
         id=123,
         portfolio_id=1,
@@ -71,17 +117,15 @@ def test_stop_loss_slippage():
         take_profit_price=110.0,
         current_price=80.0
     )
-    portfolio = MagicMock()
-    portfolio.id = 1
-    portfolio.balance = 10000.0
-
-    mock_db.query.return_value.filter.return_value.all.side_effect = [[position], []]
-    mock_db.execute.return_value.scalar_one.side_effect = [position, portfolio]
+    portfolio = SimpleNamespace(id=1, balance=10000.0)
+    db = StubDB(query_rows=[[position], []], execute_rows=[position, portfolio])
+    manager = StopLossTakeProfitManager(db)
     triggered = manager.check_all_positions()
     assert len(triggered) == 1
     assert triggered[0]["type"] == "stop_loss"
     assert triggered[0]["price"] == 80.0
     assert position.exit_price == 80.0
+    assert [t.price for t in db.added] == [80.0]
 
 
 def test_market_data_corruption():
@@ -29,6 +29,22 @@ class TestAIControlPlane(unittest.TestCase):
         self.assertEqual(report["agreement_score"], 1.0)
         self.assertEqual(report["ta_direction"], "bullish")
 
+    def test_batch_matches_single_evaluation(self):
+        rows = np.array([
+            [100.0 + i for i in range(25)],
+            [100.0 - i for i in range(25)],
+            [100.0] * 25,
+        ])
+        signal = TradingSignal(
+            action="SELL", confidence=0.9, pair="BTC/USDT", reason="Batch parity"
+        )
+        batch = self.backtester.evaluate_signals_batch(signal, rows)
+        single = [self.backtester.evaluate_signal(signal, list(row)) for row in rows]
+        self.assertEqual(
+            [(r["ta_direction"], r["agreement_score"]) for r in batch],
+            [(r["ta_direction"], r["agreement_score"]) for r in single],
+        )
+
     def test_drift_detection(self):
         # Force 10 disagreeing signals
         prices = [100.0 for _ in range(25)]  # Neutral trend
@@ -38,8 +54,9 @@ class TestAIControlPlane(unittest.TestCase):
             pair="BTC/USDT",
             reason="Drift simulation",
         )
-        for _ in range(10):
-            self.backtester.evaluate_signal(signal, prices)
+        reports = self.backtester.evaluate_signals_batch(signal, np.tile(prices, (10, 1)))
+
+        self.assertEqual([r["ta_direction"] for r in reports], ["neutral"] * 10)
 
         self.assertTrue(self.backtester.detect_drift(threshold=0.5, window=10))
 
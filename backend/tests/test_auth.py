@@ -1,5 +1,20 @@
+import pytest
 from pythia.core.auth import create_access_token, get_password_hash, verify_password
 
+TEST_USER = {
+    "username": "testuser",
+    "email": "test@example.com",
+    "password": "testpassword123",
+}
+
+
+@pytest.fixture
+def registered_user(client):
+    """Register TEST_USER; the per-test rollback removes it afterwards."""
+    response = client.post("/api/auth/register", json=TEST_USER)
+    assert response.status_code == 201
+    return TEST_USER
+
 
 def test_register_user(client):
     """Test user registration"""
@@ -18,20 +33,12 @@ def test_register_user(client):
     assert "hashed_password" not in data
 
 
-def test_register_duplicate_username(client):
+def test_register_duplicate_username(client, registered_user):
     """Test registering with duplicate username"""
-    client.post(
-        "/api/auth/register",
-        json={
-            "username": "testuser",
-            "email": "test1@example.com",
-            "password": "password123",
-        },
-    )
     response = client.post(
         "/api/auth/register",
         json={
-            "username": "testuser",
+            "username": registered_user["username"],
             "email": "test2@example.com",
             "password": "password123",
         },
@@ -39,18 +46,11 @@ def test_register_duplicate_username(client):
     assert response.status_code == 400
 
 
-def test_login(client):
+def test_login(client, registered_user):
     """Test user login"""
-    client.post(
-        "/api/auth/register",
-        json={
-            "username": "testuser",
-            "email": "test@example.com",
-            "password": "testpassword123",
-        },
-    )
     response = client.post(
-        "/api/auth/login", data={"username": "testuser", "password": "testpassword123"}
+        "/api/auth/login",
+        data={"username": registered_user["username"], "password": registered_user["password"]},
     )
     assert response.status_code == 200
     data = response.json()
@@ -58,34 +58,20 @@ def test_login(client):
     assert data["token_type"] == "bearer"
 
 
-def test_login_wrong_password(client):
+def test_login_wrong_password(client, registered_user):
     """Test login with wrong password"""
-    client.post(
-        "/api/auth/register",
-        json={
-            "username": "testuser",
-            "email": "test@example.com",
-            "password": "correctpassword",
-        },
-    )
     response = client.post(
-        "/api/auth/login", data={"username": "testuser", "password": "wrongpassword"}
+        "/api/auth/login",
+        data={"username": registered_user["username"], "password": "wrongpassword"},
     )
     assert response.status_code == 401
 
 
-def test_get_current_user(client):
+def test_get_current_user(client, registered_user):
     """Test get current user endpoint"""
-    client.post(
-        "/api/auth/register",
-        json={
-            "username": "testuser",
-            "email": "test@example.com",
-            "password": "testpassword123",
-        },
-    )
     login_response = client.post(
-        "/api/auth/login", data={"username": "testuser", "password": "testpassword123"}
+        "/api/auth/login",
+        data={"username": registered_user["username"], "password": registered_user["password"]},
     )
     token = login_response.json()["access_token"]
     response = client.get("/api/auth/me", headers={"Authorization": f"Bearer {token}"})
@@ -99,6 +85,7 @@ def test_password_hashing():
     password = "mypassword123"
     hashed = get_password_hash(password)
     assert hashed != password
+    assert hashed.startswith("$2b$04$")
     assert verify_password(password, hashed)
     assert not verify_password("wrongpassword", hashed)
 
@@ -1,16 +1,11 @@
 from datetime import datetime
 
-import pytest
-from pythia.application.backtest_engine import BacktestEngine
-
-
-@pytest.fixture
-def backtest_engine():
-    return BacktestEngine(initial_balance=10000.0)
+# Fixed timestamp keeps trade records and metrics reproducible across runs.
+FIXED_TS = datetime(2024, 1, 1)
 
 
 def test_execute_buy(backtest_engine):
-    timestamp = datetime.now()
+    timestamp = FIXED_TS
     success = backtest_engine.execute_buy(
         timestamp=timestamp, symbol="AAPL", quantity=10, price=150.0
     )
@@ -22,7 +17,7 @@ def test_execute_buy(backtest_engine):
 
 
 def test_execute_sell(backtest_engine):
-    timestamp = datetime.now()
+    timestamp = FIXED_TS
     backtest_engine.execute_buy(timestamp, "AAPL", 10, 150.0)
     success = backtest_engine.execute_sell(
         timestamp=timestamp, symbol="AAPL", quantity=5, price=160.0
@@ -34,7 +29,7 @@ def test_execute_sell(backtest_engine):
 
 
 def test_calculate_metrics(backtest_engine):
-    timestamp = datetime.now()
+    timestamp = FIXED_TS
     backtest_engine.execute_buy(timestamp, "AAPL", 10, 100.0)
     backtest_engine.execute_sell(timestamp, "AAPL", 10, 110.0)
     backtest_engine.record_equity(timestamp, {"AAPL": 110.0})
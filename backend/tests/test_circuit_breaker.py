@@ -4,8 +4,6 @@ Tests for Circuit Breaker Pattern
 Validates state transitions, failure counting, and recovery behavior.
 """
 
-import time
-
 import pytest
 from pythia.infrastructure.resilience.circuit_breaker import (
     CircuitBreaker,
@@ -16,23 +14,82 @@ from pythia.infrastructure.resilience.circuit_breaker import (
 )
 
 
+class FakeClock:
+    """Virtual monotonic clock so recovery windows elapse without sleeping."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def make_breaker(config: CircuitBreakerConfig | None = None) -> tuple[CircuitBreaker, FakeClock]:
+    breaker = CircuitBreaker("test", config)
+    clock = FakeClock()
+    breaker._now = clock
+    return breaker, clock
+
+
+# (config, ops, expected) rows; ops are replayed against a breaker on a
+# virtual clock: "fail", "succ", ("advance", seconds), or ("state", state)
+# to assert an intermediate state.
+STATE_TRANSITIONS = [
+    pytest.param(
+        CircuitBreakerConfig(),
+        [],
+        CircuitState.CLOSED,
+        id="initial->closed",
+    ),
+    pytest.param(
+        CircuitBreakerConfig(failure_threshold=3),
+        ["fail", "fail", "fail"],
+        CircuitState.OPEN,
+        id="closed->open",
+    ),
+    pytest.param(
+        CircuitBreakerConfig(failure_threshold=1, recovery_timeout=0.1),
+        ["fail", ("state", CircuitState.OPEN), ("advance", 0.15)],
+        CircuitState.HALF_OPEN,
+        id="open->half_open",
+    ),
+    pytest.param(
+        CircuitBreakerConfig(failure_threshold=1, recovery_timeout=0.1, success_threshold=2),
+        ["fail", ("advance", 0.15), ("state", CircuitState.HALF_OPEN), "succ", "succ"],
+        CircuitState.CLOSED,
+        id="half_open->closed",
+    ),
+    pytest.param(
+        CircuitBreakerConfig(failure_threshold=1, recovery_timeout=0.1),
+        ["fail", ("advance", 0.15), ("state", CircuitState.HALF_OPEN), "fail"],
+        CircuitState.OPEN,
+        id="half_open->open",
+    ),
+]
+
+
 class TestCircuitBreakerStates:
     """Test circuit breaker state transitions."""
 
-    def test_initial_state_is_closed(self):
-        """Circuit should start in CLOSED state."""
-        breaker = CircuitBreaker("test")
-        assert breaker.state == CircuitState.CLOSED
-        assert breaker.is_closed
-
-    def test_transitions_to_open_after_failures(self):
-        """Circuit should open after failure threshold reached."""
-        config = CircuitBreakerConfig(failure_threshold=3)
-        breaker = CircuitBreaker("test", config)
-        for _ in range(3):
-            breaker._record_failure(Exception("test"))
-        assert breaker.state == CircuitState.OPEN
-        assert breaker.is_open
+    @pytest.mark.parametrize("config,ops,expected", STATE_TRANSITIONS)
+    def test_state_transition(self, config, ops, expected):
+        """Replaying ops should leave the circuit in the expected state."""
+        breaker, clock = make_breaker(config)
+        for op in ops:
+            if op == "fail":
+                breaker._record_failure(Exception("test"))
+            elif op == "succ":
+                breaker._record_success()
+            elif op[0] == "advance":
+                clock.advance(op[1])
+            else:
+                assert breaker.state == op[1]
+        assert breaker.state == expected
+        assert breaker.is_closed == (expected == CircuitState.CLOSED)
+        assert breaker.is_open == (expected == CircuitState.OPEN)
 
     def test_open_circuit_rejects_calls(self):
         """Open circuit should reject calls immediately."""
@@ -44,38 +101,6 @@ class TestCircuitBreakerStates:
         assert "test" in exc.value.service_name
         assert exc.value.retry_after > 0
 
-    def test_transitions_to_half_open_after_timeout(self):
-        """Circuit should transition to HALF_OPEN after recovery timeout."""
-        config = CircuitBreakerConfig(failure_threshold=1, recovery_timeout=0.1)
-        breaker = CircuitBreaker("test", config)
-        breaker._record_failure(Exception("test"))
-        assert breaker.state == CircuitState.OPEN
-        time.sleep(0.15)
-        assert breaker.state == CircuitState.HALF_OPEN
-
-    def test_half_open_closes_on_success(self):
-        """HALF_OPEN should transition to CLOSED on successful calls."""
-        config = CircuitBreakerConfig(
-            failure_threshold=1, recovery_timeout=0.1, success_threshold=2
-        )
-        breaker = CircuitBreaker("test", config)
-        breaker._record_failure(Exception("test"))
-        time.sleep(0.15)
-        assert breaker.state == CircuitState.HALF_OPEN
-        breaker._record_success()
-        breaker._record_success()
-        assert breaker.state == CircuitState.CLOSED
-
-    def test_half_open_opens_on_failure(self):
-        """HALF_OPEN should transition back to OPEN on failure."""
-        config = CircuitBreakerConfig(failure_threshold=1, recovery_timeout=0.1)
-        breaker = CircuitBreaker("test", config)
-        breaker._record_failure(Exception("test"))
-        time.sleep(0.15)
-        assert breaker.state == CircuitState.HALF_OPEN
-        breaker._record_failure(Exception("test"))
-        assert breaker.state == CircuitState.OPEN
-
 
 class TestCircuitBreakerDecorator:
     """Test decorator functionality."""
@@ -1,4 +1,3 @@
-import asyncio
 import os
 import sys
 
@@ -9,33 +8,19 @@ backend_dir = os.path.dirname(current_dir)
 if backend_dir not in sys.path:
     sys.path.insert(0, backend_dir)
 from pythia.infrastructure.event_store import EventStore  # noqa: E402
-from pythia.infrastructure.idempotency.memory_store import IdempotencyLayer  # noqa: E402
-from pythia.infrastructure.persistence.models import Base  # noqa: E402
 from pythia.infrastructure.resilience.circuit_breaker import (  # noqa: E402
     CircuitBreaker,
     CircuitBreakerConfig,
     CircuitBreakerOpenError,
     CircuitState,
 )
-from sqlalchemy import create_engine  # noqa: E402
-from sqlalchemy.orm import sessionmaker  # noqa: E402
 
-SQL_URL = "sqlite:///:memory:"
-engine = create_engine(SQL_URL, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-
-@pytest.fixture(scope="module")
-def db_session():
-    Base.metadata.create_all(bind=engine)
-    yield SessionLocal
-    Base.metadata.drop_all(bind=engine)
-
-
-@pytest.mark.asyncio
-async def test_circuit_breaker_logic():
+def test_circuit_breaker_logic():
     config = CircuitBreakerConfig(failure_threshold=2, recovery_timeout=0.1)
     cb = CircuitBreaker("test_service", config)
+    clock = [0.0]
+    cb._now = lambda: clock[0]
 
     @cb
     def failing_service():
@@ -51,32 +36,14 @@ async def test_circuit_breaker_logic():
         failing_service()
     with pytest.raises(CircuitBreakerOpenError):
         failing_service()
-    await asyncio.sleep(0.15)
+    clock[0] += 0.15
     res = success_service()
     assert res == "Success"
     assert cb.state in [CircuitState.CLOSED, CircuitState.HALF_OPEN]
 
 
-@pytest.mark.asyncio
-async def test_idempotency_logic():
-    idem = IdempotencyLayer()
-    execution_count = 0
-
-    async def sensitive_operation(payload):
-        nonlocal execution_count
-        execution_count += 1
-        return f"Processed {payload}"
-
-    res1 = await idem.process("key-123", sensitive_operation, "data")
-    assert res1 == "Processed data"
-    assert execution_count == 1
-    res2 = await idem.process("key-123", sensitive_operation, "data")
-    assert res2 == "Processed data"
-    assert execution_count == 1
-
-
-def test_event_store_persistence(db_session):
-    store = EventStore(db_session)
+def test_event_store_persistence(db_session_factory):
+    store = EventStore(db_session_factory)
     stream_id = "trade-xyz"
     ev1 = store.append(stream_id, "TradeExecuted", {"price": 100, "qty": 10})
     assert ev1.version == 1
@@ -88,9 +55,56 @@ def test_event_store_persistence(db_session):
     assert events[1].event_type == "TradeSettled"
 
 
+def test_event_store_append_batch(db_session_factory):
+    store = EventStore(db_session_factory)
+    stream_id = "trade-batch"
+    store.append(stream_id, "TradeExecuted", {"price": 100, "qty": 10}, expected_version=None)
+    first = store.append_batch(stream_id, [("TradeFilled", {"qty": 10})])
+    assert [e.version for e in first] == [2]
+    batch = store.append_batch(
+        stream_id,
+        [("TradeSettled", {"fee": 0.5}), ("TradeClosed", {"pnl": 12.0})],
+        expected_version=2,
+    )
+    assert [e.version for e in batch] == [3, 4]
+    events = store.get_stream(stream_id)
+    assert [e.event_type for e in events] == [
+        "TradeExecuted",
+        "TradeFilled",
+        "TradeSettled",
+        "TradeClosed",
+    ]
+    with pytest.raises(ValueError, match="Concurrency conflict"):
+        store.append_batch(stream_id, [("TradeReopened", {})], expected_version=2)
+
+
+def test_event_store_append_batch_expected_version_zero(db_session_factory):
+    store = EventStore(db_session_factory)
+    stream_id = "trade-empty"
+    batch = store.append_batch(
+        stream_id,
+        [("TradeOpened", {}), ("TradeFilled", {"qty": 1}), ("TradeClosed", {})],
+        expected_version=0,
+    )
+    assert [e.version for e in batch] == [1, 2, 3]
+    with pytest.raises(ValueError, match="Concurrency conflict"):
+        store.append_batch(stream_id, [("TradeReopened", {})], expected_version=0)
+
+
+def test_event_store_append_batch_large_stream(db_session_factory):
+    store = EventStore(db_session_factory)
+    stream_id = "trade-large"
+    store.append(stream_id, "TradeOpened", {"qty": 0})
+    batch = store.append_batch(
+        stream_id,
+        [("TradeFilled", {"qty": i}) for i in range(1000)],
+        expected_version=1,
+    )
+    assert [e.version for e in batch] == list(range(2, 1002))
+    assert [e.data["qty"] for e in batch] == list(range(1000))
+    assert all(e.created_at is not None for e in batch)
+    assert len(store.get_stream(stream_id)) == 1001
+
+
 if __name__ == "__main__":
-    asyncio.run(test_circuit_breaker_logic())
-    asyncio.run(test_idempotency_logic())
-    Base.metadata.create_all(bind=engine)
-    test_event_store_persistence(SessionLocal)
-    print("ALL CORE TESTS PASSED")
+    raise SystemExit(pytest.main([__file__]))
@@ -4,10 +4,12 @@ Tests for Idempotency Implementations
 Validates request deduplication and conflict detection for both Memory and Redis stores.
 """
 
+import json
 import time
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from pythia.infrastructure.idempotency import redis_store
 from pythia.infrastructure.idempotency.memory_store import (
     IdempotencyLayer,
     InMemoryIdempotencyStore,
@@ -15,37 +17,60 @@ from pythia.infrastructure.idempotency.memory_store import (
 from pythia.infrastructure.idempotency.redis_store import IdempotencyStore as RedisIdempotencyStore
 
 
+@pytest.fixture(scope="module")
+def _shared_memory_store():
+    return InMemoryIdempotencyStore()
+
+
+@pytest.fixture
+def memory_store(_shared_memory_store):
+    """One in-memory store per module, emptied and reset for every test."""
+    store = _shared_memory_store
+    store.clear()
+    store.ttl = 3600
+    store._now = time.time
+    return store
+
+
 class TestInMemoryIdempotencyStore:
     """Test in-memory idempotency store."""
 
     @pytest.mark.asyncio
-    async def test_check_and_set_new_key(self):
+    async def test_check_and_set_new_key(self, memory_store):
         """Should return True and store payload for new key."""
-        store = InMemoryIdempotencyStore()
-        result = await store.check_and_set("key-123", {"data": "test"})
+        result = await memory_store.check_and_set("key-123", {"data": "test"})
         assert result is True
-        assert "key-123" in store._store
+        assert "key-123" in memory_store._store
 
     @pytest.mark.asyncio
-    async def test_check_and_set_existing_key(self):
+    async def test_check_and_set_existing_key(self, memory_store):
         """Should return False when key already exists."""
-        store = InMemoryIdempotencyStore()
-        await store.check_and_set("key-123", {"data": "test"})
-        result = await store.check_and_set("key-123", {"data": "test2"})
+        await memory_store.check_and_set("key-123", {"data": "test"})
+        result = await memory_store.check_and_set("key-123", {"data": "test2"})
         assert result is False
 
     @pytest.mark.asyncio
-    async def test_ttl_expiration(self):
+    async def test_ttl_expiration(self, memory_store):
         """Should clean up expired keys lazily."""
-        store = InMemoryIdempotencyStore(ttl_seconds=0)  # Expires immediately
+        store = memory_store
+        store.ttl = 60
+        clock = [1000.0]
+        store._now = lambda: clock[0]
         await store.check_and_set("key-1", {"data": "1"})
-        time.sleep(0.1)
+        clock[0] += 61  # past the TTL, without sleeping
         # check_and_set triggers lazy cleanup
         result = await store.check_and_set("key-2", {"data": "2"})
         assert result is True
         assert "key-1" not in store._store
         assert "key-2" in store._store
 
+    @pytest.mark.asyncio
+    async def test_clear_forgets_keys(self, memory_store):
+        """Should accept a key again after clear()."""
+        await memory_store.check_and_set("key-1", {"data": "1"})
+        memory_store.clear()
+        assert await memory_store.check_and_set("key-1", {"data": "1"}) is True
+
 
 class TestIdempotencyLayer:
     """Test idempotency layer for async operations."""
@@ -124,7 +149,6 @@ class TestRedisIdempotencyStore:
     @patch("pythia.infrastructure.idempotency.redis_store.redis.from_url")
     async def test_get_response(self, mock_from_url):
         """Should retrieve stored response from Redis."""
-        import json
         mock_client = AsyncMock()
         mock_client.get.return_value = json.dumps({"response": "ok"}).encode()
         mock_from_url.return_value = mock_client
@@ -134,3 +158,38 @@ class TestRedisIdempotencyStore:
 
         assert result == {"response": "ok"}
         mock_client.get.assert_called_once_with("idem:key-123")
+
+    @pytest.mark.asyncio
+    @patch("pythia.infrastructure.idempotency.redis_store.redis.from_url")
+    async def test_middleware_reuses_store(self, mock_from_url):
+        """Should build one Redis store for every trade request."""
+        mock_client = AsyncMock()
+        mock_client.register_script = Mock(return_value=AsyncMock(return_value=1))
+        mock_from_url.return_value = mock_client
+        redis_store._get_store.cache_clear()
+
+        request = Mock(method="POST", headers={"X-Idempotency-Key": "k"})
+        request.url.path = "/api/trades"
+        request.body = AsyncMock(return_value=b'{"qty":1}')
+        call_next = AsyncMock(return_value="ok")
+        try:
+            for _ in range(3):
+                assert await redis_store.idempotency_middleware(request, call_next) == "ok"
+        finally:
+            redis_store._get_store.cache_clear()
+
+        mock_from_url.assert_called_once()
+        payload = mock_client.register_script.return_value.call_args.kwargs["args"][0]
+        assert json.loads(payload) == {"body_hash": redis_store._body_fingerprint(b'{"qty":1}')}
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_payload_serialization_is_canonical(self, monkeypatch, use_orjson):
+        """Should serialize payloads independently of key order, with or without orjson."""
+        if not use_orjson:
+            monkeypatch.setattr(redis_store, "orjson", None)
+        elif redis_store.orjson is None:
+            pytest.skip("orjson not installed")
+        a = redis_store._dumps({"b": 1, "a": [1, 2]})
+        b = redis_store._dumps({"a": [1, 2], "b": 1})
+        assert a == b
+        assert redis_store._loads(a) == {"a": [1, 2], "b": 1}
@@ -0,0 +1,30 @@
+"""
+Tests for the Trade Integrity Ledger
+
+Validates hash-chain verification and tamper detection.
+"""
+
+from pythia.core.integrity import ZKPTradeIntegrity
+
+
+def _ledger(n: int = 5) -> ZKPTradeIntegrity:
+    ledger = ZKPTradeIntegrity()
+    for i in range(n):
+        ledger.log_trade({"symbol": "BTC/USD", "quantity": i, "price": 50000 + i})
+    return ledger
+
+
+def test_untouched_chain_verifies():
+    assert _ledger().verify_integrity()
+
+
+def test_tampered_payload_is_detected():
+    ledger = _ledger()
+    ledger.chain[3].data["price"] = 1
+    assert not ledger.verify_integrity()
+
+
+def test_broken_link_is_detected():
+    ledger = _ledger()
+    ledger.chain[2].prev_hash = "0" * 64
+    assert not ledger.verify_integrity()
@@ -10,61 +10,94 @@ def market_data_service():
     return MarketDataService()
 
 
-def test_get_quote_success(market_data_service):
+@pytest.fixture(scope="module", autouse=True)
+def _ticker_patch():
+    """Patch yfinance.Ticker once for the module so no test reaches the network."""
     with patch("yfinance.Ticker") as mock_ticker:
-        mock_ticker.return_value.fast_info.last_price = 150.0
-        mock_ticker.return_value.fast_info.previous_close = 145.0
-        result = market_data_service.get_quote("AAPL")
-        assert result["symbol"] == "AAPL"
-        assert result["price"] == 150.0
-        assert result["change"] == 5.0
-        assert result["change_percent"] > 0
-        assert "timestamp" in result
+        yield mock_ticker
 
 
-def test_get_quote_fallback_to_history(market_data_service):
-    with patch("yfinance.Ticker") as mock_ticker:
-        mock_ticker.return_value.fast_info.last_price = None
-        mock_history = pd.DataFrame({"Close": [150.0]})
-        mock_ticker.return_value.history.return_value = mock_history
-        result = market_data_service.get_quote("AAPL")
-        assert result["price"] == 150.0
+@pytest.fixture
+def mock_ticker(_ticker_patch):
+    """The module-wide yfinance.Ticker mock, with a fresh ticker per test."""
+    _ticker_patch.reset_mock(return_value=True)
+    return _ticker_patch
 
 
-def test_get_historical_data(market_data_service):
-    with patch("yfinance.Ticker") as mock_ticker:
-        dates = pd.date_range(start="2023-01-01", periods=5)
-        mock_data = pd.DataFrame(
-            {
-                "Open": [100.0] * 5,
-                "High": [110.0] * 5,
-                "Low": [90.0] * 5,
-                "Close": [105.0] * 5,
-                "Volume": [1000] * 5,
-            },
-            index=dates,
-        )
-        mock_ticker.return_value.history.return_value = mock_data
-        result = market_data_service.get_historical_data("AAPL", days=5)
-        assert len(result) == 5
-        assert result[0]["open"] == 100.0
-        assert "date" in result[0]
-
-
-def test_calculate_indicators(market_data_service):
-    history = []
-    for i in range(60):
-        history.append(
-            {
-                "close": 100.0 + i,
-                "open": 100.0,
-                "high": 100.0,
-                "low": 100.0,
-                "volume": 1000,
-            }
-        )
-    indicators = market_data_service.calculate_indicators(history)
+def test_get_quote_success(market_data_service, mock_ticker):
+    mock_ticker.return_value.fast_info.last_price = 150.0
+    mock_ticker.return_value.fast_info.previous_close = 145.0
+    result = market_data_service.get_quote("AAPL")
+    assert result["symbol"] == "AAPL"
+    assert result["price"] == 150.0
+    assert result["change"] == 5.0
+    assert result["change_percent"] > 0
+    assert "timestamp" in result
+
+
+def test_get_quote_fallback_to_history(market_data_service, mock_ticker):
+    mock_ticker.return_value.fast_info.last_price = None
+    mock_history = pd.DataFrame({"Close": [150.0]})
+    mock_ticker.return_value.history.return_value = mock_history
+    result = market_data_service.get_quote("AAPL")
+    assert result["price"] == 150.0
+
+
+@pytest.fixture(scope="module")
+def sample_history_df():
+    """Five daily yfinance-style OHLCV rows; treated as read-only by tests."""
+    dates = pd.date_range(start="2023-01-01", periods=5)
+    return pd.DataFrame(
+        {
+            "Open": [100.0] * 5,
+            "High": [110.0] * 5,
+            "Low": [90.0] * 5,
+            "Close": [105.0] * 5,
+            "Volume": [1000] * 5,
+        },
+        index=dates,
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_bars():
+    """Sixty rising daily bars, enough for SMA50 and RSI14."""
+    return [
+        {
+            "close": 100.0 + i,
+            "open": 100.0,
+            "high": 100.0,
+            "low": 100.0,
+            "volume": 1000,
+        }
+        for i in range(60)
+    ]
+
+
+def test_get_historical_data(market_data_service, mock_ticker, sample_history_df):
+    mock_ticker.return_value.history.return_value = sample_history_df
+    result = market_data_service.get_historical_data("AAPL", days=5)
+    assert len(result) == 5
+    assert result[0]["open"] == 100.0
+    assert "date" in result[0]
+
+
+def test_calculate_indicators(market_data_service, sample_bars):
+    indicators = market_data_service.calculate_indicators(sample_bars)
     assert "sma_20" in indicators
     assert "sma_50" in indicators
     assert "rsi" in indicators
     assert indicators["current_price"] == 159.0
+
+
+def test_indicator_values(market_data_service):
+    closes = [100.0, 102.0, 101.0, 104.0, 103.0, 105.0] * 4
+    history = [{"close": c} for c in closes]
+    indicators = market_data_service.calculate_indicators(history)
+    assert indicators["sma_20"] == pytest.approx(sum(closes[-20:]) / 20)
+    assert indicators["sma_50"] is None
+    changes = [b - a for a, b in zip(closes[-15:-1], closes[-14:], strict=True)]
+    gain = sum(c for c in changes if c > 0) / 14
+    loss = -sum(c for c in changes if c < 0) / 14
+    assert indicators["rsi"] == pytest.approx(100 - 100 / (1 + gain / loss))
+    assert market_data_service.calculate_rsi(list(range(20))) == 100.0
@@ -0,0 +1,45 @@
+"""
+Red Team attack vectors as independent test cases.
+
+Each vector from red_team_simulation runs as its own test so a failure is
+reported per vector and pytest-xdist can spread them across workers.
+"""
+
+import pytest
+from pythia.infrastructure.resilience.circuit_breaker import (
+    CircuitBreakerOpenError,
+    CircuitState,
+)
+from red_team_simulation import (
+    _new_breaker,
+    attack_vector_integrity,
+    attack_vector_resilience,
+    attack_vector_validity,
+)
+
+
+@pytest.mark.asyncio
+async def test_attack_malicious_signals_blocked():
+    await attack_vector_validity()
+
+
+def test_attack_overload_trips_circuit_breaker():
+    breaker = _new_breaker()
+    for _ in range(breaker.config.failure_threshold):
+        breaker._record_failure(ValueError("Service Overload"))
+    assert breaker.state == CircuitState.OPEN
+    with pytest.raises(CircuitBreakerOpenError):
+        with breaker:
+            pass
+
+
+@pytest.mark.chaos
+@pytest.mark.asyncio
+async def test_attack_overload_chaos():
+    """Randomised overload flood; nightly only (-m chaos)."""
+    await attack_vector_resilience(_new_breaker())
+
+
+@pytest.mark.asyncio
+async def test_attack_ledger_integrity():
+    await attack_vector_integrity()
@@ -0,0 +1,149 @@
+"""Tests for the self-scheduling prediction-market scan chain."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+pytest.importorskip("pmxt")
+
+from pythia.adapters.pmxt_adapter import PmxtRateLimitError  # noqa: E402
+from pythia.infrastructure import tasks  # noqa: E402
+
+
+class FakeRedis:
+    """In-memory stand-in for the few Redis calls the scan chain makes."""
+
+    def __init__(self):
+        self.store: dict[str, bytes] = {}
+        self.ttl: dict[str, int | None] = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.store:
+            return None
+        self.store[key] = str(value).encode()
+        self.ttl[key] = ex
+        return True
+
+    def eval(self, script, numkeys, key, token, ttl):
+        # Same compare-and-expire as _RENEW_LEASE_LUA.
+        if self.store.get(key) == token.encode():
+            self.ttl[key] = ttl
+            return 1
+        return 0
+
+    def expire(self, key):
+        """Let a key lapse, as its TTL running out would."""
+        self.store.pop(key, None)
+        self.ttl.pop(key, None)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(tasks, "_get_redis", lambda: fake)
+    return fake
+
+
+@pytest.fixture
+def scan_task(monkeypatch, fake_redis):
+    """The scan task with no markets to fetch and apply_async recorded."""
+    adapter = MagicMock()
+    adapter.fetch_markets = AsyncMock(return_value=[])
+    monkeypatch.setattr(tasks, "_get_pmxt_adapter", lambda *args: adapter)
+    monkeypatch.delenv("POLYMARKET_WALLET_KEY", raising=False)
+    task = tasks.scan_prediction_markets
+    monkeypatch.setattr(task, "apply_async", MagicMock())
+    return task
+
+
+def _lease(fake_redis):
+    return fake_redis.get(tasks._SCAN_LEASE_KEY).decode()
+
+
+class TestScanChainLease:
+    def test_watchdog_starts_chain_when_no_lease(self, scan_task, fake_redis):
+        result = scan_task.run()
+        assert result["next_scan_in"] is not None
+        token = _lease(fake_redis)
+        scan_task.apply_async.assert_called_once_with(
+            kwargs={"chain_token": token}, countdown=result["next_scan_in"]
+        )
+
+    def test_watchdog_skips_while_chain_holds_lease(self, scan_task, fake_redis):
+        scan_task.run()
+        scan_task.apply_async.reset_mock()
+        # The chained run is overdue (queued late, running or retrying), but
+        # its lease is still live, so the watchdog must not fork a second chain.
+        assert scan_task.run() == {"skipped": True}
+        scan_task.apply_async.assert_not_called()
+
+    def test_chained_run_continues_its_own_chain(self, scan_task, fake_redis):
+        scan_task.run()
+        token = _lease(fake_redis)
+        scan_task.apply_async.reset_mock()
+        result = scan_task.run(chain_token=token)
+        assert "skipped" not in result
+        scan_task.apply_async.assert_called_once()
+        assert _lease(fake_redis) == token
+
+    def test_chained_run_exits_after_losing_lease(self, scan_task, fake_redis):
+        scan_task.run()
+        stale_token = _lease(fake_redis)
+        fake_redis.expire(tasks._SCAN_LEASE_KEY)
+        scan_task.run()  # watchdog takes over with a fresh chain
+        scan_task.apply_async.reset_mock()
+        assert scan_task.run(chain_token=stale_token) == {"skipped": True}
+        scan_task.apply_async.assert_not_called()
+
+    def test_rate_limited_scan_skips_to_slowest_slot(self, scan_task, fake_redis, monkeypatch):
+        adapter = tasks._get_pmxt_adapter()
+        adapter.fetch_markets.side_effect = PmxtRateLimitError("429")
+        retry = MagicMock()
+        monkeypatch.setattr(scan_task, "retry", retry)
+        result = scan_task.run()
+        assert result == {"rate_limited": True, "next_scan_in": tasks.SCAN_MAX_INTERVAL}
+        retry.assert_not_called()
+        scan_task.apply_async.assert_called_once_with(
+            kwargs={"chain_token": _lease(fake_redis)}, countdown=tasks.SCAN_MAX_INTERVAL
+        )
+        assert fake_redis.ttl[tasks._SCAN_LEASE_KEY] == (
+            int(tasks.SCAN_MAX_INTERVAL) + tasks.SCAN_ATTEMPT_LEASE
+        )
+
+    def test_lease_covers_countdown_and_next_attempt(self, scan_task, fake_redis):
+        result = scan_task.run()
+        expected = int(result["next_scan_in"]) + tasks.SCAN_ATTEMPT_LEASE
+        assert fake_redis.ttl[tasks._SCAN_LEASE_KEY] == expected
+
+
+class TestScanCadence:
+    def test_quiet_markets_stretch_to_max_interval(self, fake_redis):
+        task = MagicMock()
+        fake_redis.set(tasks._SCAN_LEASE_KEY, "t")
+        intervals = [tasks._schedule_next_scan(task, "t", 0) for _ in range(3)]
+        assert intervals == [tasks.SCAN_MAX_INTERVAL] * 3
+
+    def test_opportunities_shorten_interval_to_min(self, fake_redis):
+        task = MagicMock()
+        fake_redis.set(tasks._SCAN_LEASE_KEY, "t")
+        intervals = [tasks._schedule_next_scan(task, "t", 10) for _ in range(5)]
+        assert intervals == sorted(intervals, reverse=True)
+        assert intervals[-1] == tasks.SCAN_MIN_INTERVAL
+
+    def test_rate_is_shared_through_redis(self, fake_redis, monkeypatch):
+        """A second worker process continues the EWMA instead of starting at zero."""
+        task = MagicMock()
+        fake_redis.set(tasks._SCAN_LEASE_KEY, "t")
+        first = tasks._schedule_next_scan(task, "t", 4)
+        monkeypatch.setattr(tasks, "_SCAN_CADENCE", tasks._ScanCadence())
+        second = tasks._schedule_next_scan(task, "t", 4)
+        assert second < first
+        assert float(fake_redis.get(tasks._SCAN_RATE_KEY)) == pytest.approx(2.04)
+
+    def test_no_schedule_without_lease(self, fake_redis):
+        task = MagicMock()
+        assert tasks._schedule_next_scan(task, "t", 1) is None
+        task.apply_async.assert_not_called()
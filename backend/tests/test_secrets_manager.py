@@ -0,0 +1,22 @@
+"""
+Tests for SecretsManager
+
+Validates Fernet round-tripping and on-disk key provisioning.
+"""
+
+import pytest
+from pythia.infrastructure.secrets.secrets_manager import SecretsManager
+
+
+def test_secrets_manager_encryption(secrets_manager):
+    """Encrypted secrets should round-trip and never equal the plaintext."""
+    ciphertext = secrets_manager.encrypt_secret("alpaca-secret")
+    assert ciphertext != "alpaca-secret"
+    assert secrets_manager.decrypt_secret(ciphertext) == "alpaca-secret"
+
+
+def test_missing_key_without_generation_raises(tmp_path, monkeypatch):
+    """Production mode must refuse to invent a key."""
+    monkeypatch.delenv("PYTHIA_MASTER_KEY", raising=False)
+    with pytest.raises(FileNotFoundError):
+        SecretsManager(encryption_key_path=tmp_path / "missing")
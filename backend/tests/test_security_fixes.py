@@ -3,113 +3,91 @@ Comprehensive test suite for P0 security fixes
 Run with: pytest tests/test_security_fixes.py -v
 """
 
-import asyncio
+from datetime import datetime, timedelta
 from decimal import Decimal
+from functools import cache
 from unittest.mock import Mock, patch
 
 import pytest
 from pythia.core.errors import ValidationError
 from pythia.core.validators import PriceValidator, QuantityValidator, SymbolValidator
+from pythia.infrastructure.persistence.models import Portfolio, Position
+from sqlalchemy import select
 
 
 class TestPriceValidator:
     """Test strict price validation"""
 
-    def test_valid_prices(self):
-        """Valid prices should convert to Decimal"""
-        assert PriceValidator.validate(100.5) == Decimal("100.50")
-        assert PriceValidator.validate(0.01) == Decimal("0.01")
-        assert PriceValidator.validate(999999.99) == Decimal("999999.99")
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            (100.5, "100.50"),
+            (0.01, "0.01"),
+            (999999.99, "999999.99"),
+            (100.999, "101.00"),  # rounds to 2 decimals
+        ],
+    )
+    def test_valid_prices(self, value, expected):
+        """Valid prices should convert to a 2-decimal Decimal"""
+        assert PriceValidator.validate(value) == Decimal(expected)
 
-    def test_negative_price_rejected(self):
-        """Negative prices must be rejected"""
+    @pytest.mark.parametrize(
+        "value", [-100, 0, 0.001, 2000000, float("inf"), float("nan")]
+    )
+    def test_invalid_prices_rejected(self, value):
+        """Non-positive, out-of-range and non-finite prices must be rejected"""
+        with pytest.raises(ValidationError):
+            PriceValidator.validate(value)
+
+    def test_negative_price_message(self):
+        """Negative price errors should explain the price must be positive"""
         with pytest.raises(ValidationError) as exc:
             PriceValidator.validate(-100)
         assert "positive" in str(exc.value).lower()
 
-    def test_zero_price_rejected(self):
-        """Zero price must be rejected"""
-        with pytest.raises(ValidationError):
-            PriceValidator.validate(0)
-
-    def test_below_minimum_rejected(self):
-        """Prices below minimum must be rejected"""
-        with pytest.raises(ValidationError):
-            PriceValidator.validate(0.001)
-
-    def test_above_maximum_rejected(self):
-        """Prices above maximum must be rejected"""
-        with pytest.raises(ValidationError):
-            PriceValidator.validate(2000000)
-
-    def test_infinity_rejected(self):
-        """Infinity must be rejected"""
-        with pytest.raises(ValidationError):
-            PriceValidator.validate(float("inf"))
-
-    def test_nan_rejected(self):
-        """NaN must be rejected"""
-        with pytest.raises(ValidationError):
-            PriceValidator.validate(float("nan"))
-
-    def test_precision_rounding(self):
-        """Prices should round to 2 decimals"""
-        result = PriceValidator.validate(100.999)
-        assert result == Decimal("101.00")
-
 
 class TestQuantityValidator:
     """Test quantity validation"""
 
-    def test_valid_quantities(self):
+    @pytest.mark.parametrize("value, expected", [(10.5, "10.5000"), (0.0001, "0.0001")])
+    def test_valid_quantities(self, value, expected):
         """Valid quantities should convert to Decimal"""
-        assert QuantityValidator.validate(10.5) == Decimal("10.5000")
-        assert QuantityValidator.validate(0.0001) == Decimal("0.0001")
-
-    def test_negative_quantity_rejected(self):
-        """Negative quantities must be rejected"""
-        with pytest.raises(ValidationError):
-            QuantityValidator.validate(-10)
+        assert QuantityValidator.validate(value) == Decimal(expected)
 
-    def test_zero_quantity_rejected(self):
-        """Zero quantity must be rejected"""
+    @pytest.mark.parametrize("value", [-10, 0])
+    def test_invalid_quantities_rejected(self, value):
+        """Negative and zero quantities must be rejected"""
         with pytest.raises(ValidationError):
-            QuantityValidator.validate(0)
+            QuantityValidator.validate(value)
 
 
 class TestSymbolValidator:
     """Test symbol validation"""
 
-    def test_valid_symbols(self):
+    @pytest.mark.parametrize(
+        "value, expected", [("aapl", "AAPL"), ("MSFT", "MSFT"), ("BTC", "BTC")]
+    )
+    def test_valid_symbols(self, value, expected):
         """Valid symbols should be uppercase"""
-        assert SymbolValidator.validate("aapl") == "AAPL"
-        assert SymbolValidator.validate("MSFT") == "MSFT"
-        assert SymbolValidator.validate("BTC") == "BTC"
-
-    def test_empty_symbol_rejected(self):
-        """Empty symbol must be rejected"""
-        with pytest.raises(ValidationError):
-            SymbolValidator.validate("")
-
-    def test_special_characters_rejected(self):
-        """Symbols with special characters must be rejected"""
-        with pytest.raises(ValidationError):
-            SymbolValidator.validate("AAPL; DROP TABLE")
+        assert SymbolValidator.validate(value) == expected
 
-    def test_too_long_rejected(self):
-        """Symbols exceeding max length must be rejected"""
+    @pytest.mark.parametrize("value", ["", "AAPL; DROP TABLE", "A" * 20])
+    def test_invalid_symbols_rejected(self, value):
+        """Empty, special-character and over-long symbols must be rejected"""
         with pytest.raises(ValidationError):
-            SymbolValidator.validate("A" * 20)
+            SymbolValidator.validate(value)
 
 
-@pytest.mark.asyncio
 class TestConcurrentTradeExecution:
     """Test race condition protection"""
 
-    async def test_concurrent_trades_no_race_condition(
+    def test_repeated_trades_never_overdraw_balance(
         self, db_session, test_portfolio
     ):
-        """100 concurrent trades should not cause race conditions"""
+        """100 back-to-back buys must never take the balance below zero.
+
+        This runs sequentially; row-lock contention is covered by the NOWAIT test.
+        """
         from pythia.core.enhanced_trading_engine_v2 import EnhancedTradingEngine
         from pythia.infrastructure.persistence.repositories import (
             SqlAlchemyPortfolioRepository,
@@ -121,7 +99,10 @@ class TestConcurrentTradeExecution:
             trade_repo=SqlAlchemyTradeRepository(db_session)
         )
 
-        async def execute_trade():
+        # execute_trade is synchronous and db_session is a single connection,
+        # so the 100 attempts run back to back; a thread pool would only
+        # share one non-thread-safe Session between workers.
+        def execute_trade():
             try:
                 return engine.execute_trade(
                     portfolio_id=test_portfolio.id,
@@ -133,17 +114,18 @@ class TestConcurrentTradeExecution:
             except Exception as e:
                 return {"error": str(e)}
 
-        tasks = [execute_trade() for _ in range(100)]
-        results = await asyncio.gather(*tasks)
-        db_session.refresh(test_portfolio)
-        assert test_portfolio.balance >= Decimal("10.0")
+        results = [execute_trade() for _ in range(100)]
+        balance = db_session.execute(
+            select(Portfolio.balance).where(Portfolio.id == test_portfolio.id)
+        ).scalar_one()
+        assert balance >= Decimal("10.0")
         successful = [r for r in results if r.get("success")]
         failed = [r for r in results if "error" in r]
         assert len(successful) > 0
         assert len(failed) > 0
-        assert test_portfolio.balance >= 0
+        assert balance >= 0
 
-    async def test_lock_timeout_immediate_failure(self, db_session, test_portfolio):
+    def test_lock_timeout_immediate_failure(self, db_session, test_portfolio):
         """Lock contention should fail immediately with NOWAIT"""
         from unittest.mock import patch
 
@@ -165,6 +147,13 @@ class TestConcurrentTradeExecution:
             assert "concurrent" in str(exc.value).lower()
 
 
+def _position_status(db_session, position_id):
+    """Read the stored status column without re-hydrating the Position."""
+    return db_session.execute(
+        select(Position.status).where(Position.id == position_id)
+    ).scalar_one()
+
+
 class TestStopLossAtomicity:
     """Test atomic stop-loss execution"""
 
@@ -183,8 +172,7 @@ class TestStopLossAtomicity:
         )
         assert trade is not None
         assert trade.pnl is not None
-        db_session.refresh(test_position)
-        assert test_position.status == "closed"
+        assert _position_status(db_session, test_position.id) == "closed"
 
     def test_position_closure_rollback_on_error(self, db_session, test_position):
         """Position closure should rollback completely on error"""
@@ -196,8 +184,7 @@ class TestStopLossAtomicity:
         ):
             with pytest.raises(Exception):  # noqa: B017
                 manager._close_position(test_position, "stop_loss")
-        db_session.refresh(test_position)
-        assert test_position.status == "open"
+        assert _position_status(db_session, test_position.id) == "open"
         from pythia.infrastructure.persistence.models import Trade
 
         trade_count = (
@@ -208,116 +195,119 @@ class TestStopLossAtomicity:
         assert trade_count == 0
 
 
+class FakeWS:
+    """WebSocket stand-in exposing only what authenticate_websocket touches."""
+
+    def __init__(self, query_params=None, headers=None):
+        self.query_params = query_params or {}
+        self.headers = headers or {}
+        self.closed = 0
+
+    async def close(self, code=1000, reason=None):
+        self.closed += 1
+
+
 @pytest.mark.asyncio
 class TestWebSocketAuthentication:
     """Test WebSocket authentication"""
 
     async def test_websocket_requires_token(self):
         """WebSocket connection without token should be rejected"""
-        from unittest.mock import AsyncMock
-
-        from fastapi import WebSocket
         from pythia.core.websocket_auth import authenticate_websocket
 
-        mock_ws = AsyncMock(spec=WebSocket)
-        mock_ws.query_params = {}
-        mock_ws.headers = {}
-        mock_ws.close = AsyncMock()
-        result = await authenticate_websocket(mock_ws)
+        ws = FakeWS()
+        result = await authenticate_websocket(ws)
         assert result is None
-        mock_ws.close.assert_called_once()
+        assert ws.closed == 1
 
     async def test_websocket_invalid_token_rejected(self):
         """WebSocket with invalid token should be rejected"""
-        from unittest.mock import AsyncMock
-
-        from fastapi import WebSocket
         from pythia.core.websocket_auth import authenticate_websocket
 
-        mock_ws = AsyncMock(spec=WebSocket)
-        mock_ws.query_params = {"token": "invalid_token"}
-        mock_ws.headers = {}
-        mock_ws.close = AsyncMock()
-        result = await authenticate_websocket(mock_ws)
+        ws = FakeWS(query_params={"token": "invalid_token"})
+        result = await authenticate_websocket(ws)
         assert result is None
-        mock_ws.close.assert_called_once()
+        assert ws.closed == 1
 
     async def test_websocket_valid_token_accepted(self, valid_jwt_token, test_user):
         """WebSocket with valid token should be accepted"""
-        from unittest.mock import AsyncMock
-
-        from fastapi import WebSocket
         from pythia.core.websocket_auth import authenticate_websocket
 
-        mock_ws = AsyncMock(spec=WebSocket)
-        mock_ws.query_params = {"token": valid_jwt_token}
-        mock_ws.headers = {}
+        ws = FakeWS(query_params={"token": valid_jwt_token})
         with patch("pythia.core.websocket_auth.get_db") as mock_get_db:
             mock_db = Mock()
             mock_db.query().filter().first.return_value = test_user
             mock_get_db.return_value = iter([mock_db])
-            result = await authenticate_websocket(mock_ws)
+            result = await authenticate_websocket(ws)
             assert result == test_user
+        assert ws.closed == 0
 
 
 @pytest.fixture
-def test_portfolio(db_session):
-    """Create test portfolio"""
-    from pythia.infrastructure.persistence.models import Portfolio, User
-
-    user = User(email="test@test.com", username="testuser", hashed_password="hash")
-    db_session.add(user)
-    db_session.commit()
-    portfolio = Portfolio(user_id=user.id, balance=10000.0, total_value=10000.0)
-    db_session.add(portfolio)
-    db_session.commit()
-    return portfolio
+def seeded_state(db_session):
+    """User, portfolio and one open AAPL position, inserted in one flush.
 
+    The rows are committed (a SAVEPOINT release inside conftest's rolled-back
+    transaction) so tests that roll the session back still find them.
+    """
+    from pythia.infrastructure.persistence.models import Portfolio, Position, User
 
-@pytest.fixture
-def test_position(db_session, test_portfolio):
-    """Create test position"""
-    from pythia.infrastructure.persistence.models import Position
-
+    user = User(
+        email="test@test.com",
+        username="testuser",
+        hashed_password="hash",
+        is_active=True,
+    )
+    portfolio = Portfolio(user=user, balance=10000.0, total_value=10000.0)
     position = Position(
-        portfolio_id=test_portfolio.id,
+        portfolio=portfolio,
         symbol="AAPL",
         quantity=10.0,
         average_price=150.0,
         current_price=155.0,
         status="open",
     )
-    db_session.add(position)
+    db_session.add_all([user, portfolio, position])
     db_session.commit()
-    return position
+    return user, portfolio, position
 
 
 @pytest.fixture
-def test_user(db_session):
-    """Create test user"""
-    from pythia.infrastructure.persistence.models import User
+def test_portfolio(seeded_state):
+    """Create test portfolio"""
+    return seeded_state[1]
 
-    user = User(
-        email="test@test.com",
-        username="testuser",
-        hashed_password="hash",
-        is_active=True,
-    )
-    db_session.add(user)
-    db_session.commit()
-    return user
+
+@pytest.fixture
+def test_position(seeded_state):
+    """Create test position"""
+    return seeded_state[2]
 
 
 @pytest.fixture
-def valid_jwt_token(test_user):
-    """Generate valid JWT token"""
-    from datetime import datetime, timedelta
+def test_user(seeded_state):
+    """Create test user"""
+    return seeded_state[0]
+
 
+@cache
+def _jwt_for(user_id: int) -> str:
+    """Sign one token per user id per run.
+
+    The token stays valid for a day, so reusing it is safe however long the
+    test session runs.
+    """
     from jose import jwt
     from pythia.core.config import settings
 
     payload = {
-        "sub": str(test_user.id),
-        "exp": datetime.utcnow() + timedelta(minutes=30),
+        "sub": str(user_id),
+        "exp": datetime.utcnow() + timedelta(days=1),
     }
     return jwt.encode(payload, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+
+
+@pytest.fixture
+def valid_jwt_token(test_user):
+    """Generate valid JWT token"""
+    return _jwt_for(test_user.id)
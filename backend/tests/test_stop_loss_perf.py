@@ -0,0 +1,43 @@
+"""
+Benchmarks for the StopLossTakeProfitManager scan path.
+
+Run with: pytest tests/test_stop_loss_perf.py -m slow --perf-rounds 20
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from pythia.application.stop_loss_manager import StopLossTakeProfitManager
+from query_stubs import StubSession
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.slow
+
+
+@pytest.fixture
+def open_book():
+    """Fifty open positions priced between their stop-loss and take-profit."""
+    return [
+        SimpleNamespace(
+            id=i,
+            status="open",
+            symbol=f"SYM{i}",
+            current_price=100.0,
+            stop_loss_price=90.0,
+            take_profit_price=110.0,
+            trailing_stop_pct=None,
+        )
+        for i in range(50)
+    ]
+
+
+def test_check_all_positions_perf(benchmark, perf_settings, open_book):
+    manager = StopLossTakeProfitManager(StubSession(open_book))
+    triggered = benchmark.pedantic(
+        manager.check_all_positions,
+        rounds=perf_settings["rounds"],
+        iterations=perf_settings["iterations"],
+        warmup_rounds=5,
+    )
+    assert triggered == []
@@ -10,12 +10,16 @@ Covers:
 - _close_position with DB exception (atomic rollback)
 """
 
-from unittest.mock import MagicMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 import pytest
 from pythia.application.stop_loss_manager import StopLossTakeProfitManager
 from pythia.core.errors import ErrorCode, TradingError
-from pythia.infrastructure.persistence.models import Portfolio, Position
+from query_stubs import StubQuery
+
+# Positions and portfolios are SimpleNamespaces: Mock(spec=Position) would
+# introspect the ORM model on every test for the handful of fields read here.
 
 
 @pytest.fixture
@@ -32,21 +36,23 @@ def stop_loss_manager(mock_db_session):
 
 
 def test_check_stop_loss_trigger(stop_loss_manager, mock_db_session):
-    position = Mock(spec=Position)
-    position.id = 1
-    position.status = "open"
-    position.symbol = "AAPL"
-    position.current_price = 90.0
-    position.average_price = 95.0
-    position.stop_loss_price = 95.0
-    position.take_profit_price = 110.0
-    position.trailing_stop_pct = None
-    position.quantity = 10.0
-    position.portfolio_id = 1
-    mock_db_session.query.return_value.filter.return_value.all.return_value = [position]
-    portfolio = Mock(spec=Portfolio)
-    portfolio.id = 1
-    portfolio.balance = 1000.0
+    position = SimpleNamespace(
+        id=1,
+        status="open",
+        symbol="AAPL",
+        current_price=90.0,
+        average_price=95.0,
+        stop_loss_price=95.0,
+        take_profit_price=110.0,
+        trailing_stop_pct=None,
+        quantity=10.0,
+        portfolio_id=1,
+    )
+    mock_db_session.query.return_value = StubQuery([position])
+    portfolio = SimpleNamespace(
+        id=1,
+        balance=1000.0,
+    )
     mock_db_session.execute.return_value.scalar_one.side_effect = [position, portfolio]
 
     triggered = stop_loss_manager.check_all_positions()
@@ -57,21 +63,23 @@ def test_check_stop_loss_trigger(stop_loss_manager, mock_db_session):
 
 
 def test_check_take_profit_trigger(stop_loss_manager, mock_db_session):
-    position = Mock(spec=Position)
-    position.id = 2
-    position.status = "open"
-    position.symbol = "AAPL"
-    position.current_price = 115.0
-    position.average_price = 100.0
-    position.stop_loss_price = 90.0
-    position.take_profit_price = 110.0
-    position.trailing_stop_pct = None
-    position.quantity = 10.0
-    position.portfolio_id = 1
-    mock_db_session.query.return_value.filter.return_value.all.return_value = [position]
-    portfolio = Mock(spec=Portfolio)
-    portfolio.id = 1
-    portfolio.balance = 1000.0
+    position = SimpleNamespace(
+        id=2,
+        status="open",
+        symbol="AAPL",
+        current_price=115.0,
+        average_price=100.0,
+        stop_loss_price=90.0,
+        take_profit_price=110.0,
+        trailing_stop_pct=None,
+        quantity=10.0,
+        portfolio_id=1,
+    )
+    mock_db_session.query.return_value = StubQuery([position])
+    portfolio = SimpleNamespace(
+        id=1,
+        balance=1000.0,
+    )
     mock_db_session.execute.return_value.scalar_one.side_effect = [position, portfolio]
 
     triggered = stop_loss_manager.check_all_positions()
@@ -82,16 +90,17 @@ def test_check_take_profit_trigger(stop_loss_manager, mock_db_session):
 
 
 def test_update_trailing_stop(stop_loss_manager, mock_db_session):
-    position = Mock(spec=Position)
-    position.id = 3
-    position.status = "open"
-    position.symbol = "AAPL"
-    position.current_price = 120.0
-    position.stop_loss_price = 100.0
-    position.take_profit_price = 150.0
-    position.trailing_stop_pct = 0.1
-    position.quantity = 10.0
-    mock_db_session.query.return_value.filter.return_value.all.return_value = [position]
+    position = SimpleNamespace(
+        id=3,
+        status="open",
+        symbol="AAPL",
+        current_price=120.0,
+        stop_loss_price=100.0,
+        take_profit_price=150.0,
+        trailing_stop_pct=0.1,
+        quantity=10.0,
+    )
+    mock_db_session.query.return_value = StubQuery([position])
     mock_db_session.execute.return_value.scalar_one.return_value = position
     stop_loss_manager.trailing_stop = True
     stop_loss_manager.check_all_positions()
@@ -106,12 +115,13 @@ class TestClosePositionValidation:
 
     def test_close_position_symbol_none_raises(self, stop_loss_manager):
         """_close_position must reject positions with symbol=None."""
-        position = Mock(spec=Position)
-        position.id = 10
-        position.symbol = None
-        position.quantity = 5.0
-        position.current_price = 100.0
-        position.portfolio_id = 1
+        position = SimpleNamespace(
+            id=10,
+            symbol=None,
+            quantity=5.0,
+            current_price=100.0,
+            portfolio_id=1,
+        )
 
         with pytest.raises(TradingError) as exc_info:
             stop_loss_manager._close_position(position, "stop_loss")
@@ -121,12 +131,13 @@ class TestClosePositionValidation:
 
     def test_close_position_symbol_empty_raises(self, stop_loss_manager):
         """_close_position must reject positions with empty string symbol."""
-        position = Mock(spec=Position)
-        position.id = 11
-        position.symbol = ""
-        position.quantity = 5.0
-        position.current_price = 100.0
-        position.portfolio_id = 1
+        position = SimpleNamespace(
+            id=11,
+            symbol="",
+            quantity=5.0,
+            current_price=100.0,
+            portfolio_id=1,
+        )
 
         with pytest.raises(TradingError) as exc_info:
             stop_loss_manager._close_position(position, "stop_loss")
@@ -136,12 +147,13 @@ class TestClosePositionValidation:
 
     def test_close_position_quantity_zero_raises(self, stop_loss_manager):
         """_close_position must reject positions with quantity <= 0."""
-        position = Mock(spec=Position)
-        position.id = 12
-        position.symbol = "AAPL"
-        position.quantity = 0
-        position.current_price = 100.0
-        position.portfolio_id = 1
+        position = SimpleNamespace(
+            id=12,
+            symbol="AAPL",
+            quantity=0,
+            current_price=100.0,
+            portfolio_id=1,
+        )
 
         with pytest.raises(TradingError) as exc_info:
             stop_loss_manager._close_position(position, "stop_loss")
@@ -151,12 +163,13 @@ class TestClosePositionValidation:
 
     def test_close_position_no_current_price_raises(self, stop_loss_manager):
         """_close_position must reject positions with current_price=None."""
-        position = Mock(spec=Position)
-        position.id = 13
-        position.symbol = "AAPL"
-        position.quantity = 5.0
-        position.current_price = None
-        position.portfolio_id = 1
+        position = SimpleNamespace(
+            id=13,
+            symbol="AAPL",
+            quantity=5.0,
+            current_price=None,
+            portfolio_id=1,
+        )
 
         with pytest.raises(TradingError) as exc_info:
             stop_loss_manager._close_position(position, "stop_loss")
@@ -166,12 +179,13 @@ class TestClosePositionValidation:
 
     def test_close_position_no_portfolio_id_raises(self, stop_loss_manager):
         """_close_position must reject positions with portfolio_id=None."""
-        position = Mock(spec=Position)
-        position.id = 14
-        position.symbol = "AAPL"
-        position.quantity = 5.0
-        position.current_price = 100.0
-        position.portfolio_id = None
+        position = SimpleNamespace(
+            id=14,
+            symbol="AAPL",
+            quantity=5.0,
+            current_price=100.0,
+            portfolio_id=None,
+        )
 
         with pytest.raises(TradingError) as exc_info:
             stop_loss_manager._close_position(position, "stop_loss")
@@ -185,23 +199,25 @@ class TestClosePositionSuccess:
 
     def test_close_position_ok(self, stop_loss_manager, mock_db_session):
         """Happy path: valid position closes atomically, trade record created."""
-        position = Mock(spec=Position)
-        position.id = 20
-        position.symbol = "TSLA"
-        position.quantity = 5.0
-        position.current_price = 200.0
-        position.average_price = 180.0
-        position.portfolio_id = 1
-
-        portfolio = Mock(spec=Portfolio)
-        portfolio.id = 1
-        portfolio.balance = 5000.0
+        position = SimpleNamespace(
+            id=20,
+            symbol="TSLA",
+            quantity=5.0,
+            current_price=200.0,
+            average_price=180.0,
+            portfolio_id=1,
+        )
+
+        portfolio = SimpleNamespace(
+            id=1,
+            balance=5000.0,
+        )
 
         # After close, remaining open positions query returns empty
         mock_db_session.execute.return_value.scalar_one.side_effect = [
             position, portfolio
         ]
-        mock_db_session.query.return_value.filter.return_value.all.return_value = []
+        mock_db_session.query.return_value = StubQuery([])
 
         stop_loss_manager._close_position(position, "stop_loss")
 
@@ -222,13 +238,14 @@ class TestClosePositionDbException:
         """If the DB raises during atomic_transaction, error must be
         wrapped as TradingError with TRADE_EXECUTION_FAILED and the
         transaction must be rolled back."""
-        position = Mock(spec=Position)
-        position.id = 30
-        position.symbol = "GOOG"
-        position.quantity = 2.0
-        position.current_price = 150.0
-        position.average_price = 140.0
-        position.portfolio_id = 1
+        position = SimpleNamespace(
+            id=30,
+            symbol="GOOG",
+            quantity=2.0,
+            current_price=150.0,
+            average_price=140.0,
+            portfolio_id=1,
+        )
 
         # Simulate DB failure on execute (e.g. SELECT FOR UPDATE fails)
         mock_db_session.execute.side_effect = RuntimeError("DB connection lost")
@@ -246,17 +263,19 @@ class TestClosePositionDbException:
     ):
         """If flush() raises (e.g. constraint violation), the atomic
         transaction must rollback and error wraps as TradingError."""
-        position = Mock(spec=Position)
-        position.id = 31
-        position.symbol = "AMZN"
-        position.quantity = 3.0
-        position.current_price = 180.0
-        position.average_price = 170.0
-        position.portfolio_id = 1
-
-        portfolio = Mock(spec=Portfolio)
-        portfolio.id = 1
-        portfolio.balance = 10000.0
+        position = SimpleNamespace(
+            id=31,
+            symbol="AMZN",
+            quantity=3.0,
+            current_price=180.0,
+            average_price=170.0,
+            portfolio_id=1,
+        )
+
+        portfolio = SimpleNamespace(
+            id=1,
+            balance=10000.0,
+        )
 
         mock_db_session.execute.return_value.scalar_one.side_effect = [
             position, portfolio
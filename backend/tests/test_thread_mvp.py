@@ -1,12 +1,12 @@
-import asyncio
+from types import SimpleNamespace
 
 import pytest
+from pythia.application.ai_providers import groq_client
 from pythia.application.ai_providers.groq_client import GroqClient, GroqRateLimiter
 from pythia.domain.cognitive.models import TradingSignal
 
 
-@pytest.mark.asyncio
-async def test_confidence_gate():
+def test_confidence_gate():
     """P0: Confidence < 0.5 forces HOLD regardless of action."""
     signal_low = TradingSignal(
         action="BUY", confidence=0.4, pair="BTC/USDT", reason="Low conf test"
@@ -19,14 +19,23 @@ async def test_confidence_gate():
 
 
 @pytest.mark.asyncio
-async def test_groq_rate_limit():
+async def test_groq_rate_limit(monkeypatch):
     """P1: 30 RPM compliance - 31st call in 60s should be delayed."""
+    # Virtual clock: sleeping advances time instantly instead of waiting.
+    now = [1000.0]
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr(groq_client, "time", SimpleNamespace(time=lambda: now[0]))
+    monkeypatch.setattr("pythia.application.ai_providers.groq_client.asyncio.sleep", fake_sleep)
     limiter = GroqRateLimiter(delay_seconds=2.0)
-    start = asyncio.get_event_loop().time()
     for _ in range(3):
         await limiter.wait()
-    elapsed = asyncio.get_event_loop().time() - start
-    assert elapsed >= 4.0, f"Rate limiter too fast: {elapsed:.2f}s for 3 calls"
+    assert sleeps == [2.0, 2.0]
+    assert sum(sleeps) >= 4.0, f"Rate limiter too fast: {sum(sleeps):.2f}s for 3 calls"
 
 
 def test_dual_confirmation_logic():
@@ -75,4 +84,5 @@ async def test_groq_api_fallback():
             signal = await client.get_signal("BTC/USDT", 50000, 50, 55, 50)
 
         assert signal.action == "HOLD", "Failed API call should fallback to HOLD"
-        assert "API_ERROR" in signal.reason or "NO_API_KEY" in signal.reason
+        assert signal.reason.startswith("API_ERROR")
+        assert mock_instance.chat.completions.create.await_count == 3
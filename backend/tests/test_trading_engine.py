@@ -1,34 +1,56 @@
-from unittest.mock import Mock
+from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 from pythia.application.ai.specialized_agents import AgentCoordinator
 
+PRICES = np.full(20, 100.0)
+VOLUMES = np.full(20, 1000.0)
+
+_SUB_AGENTS = ("technical_agent", "sentiment_agent", "risk_agent", "execution_agent")
+
+
+@pytest.fixture(scope="module")
+def _coordinator():
+    coordinator = AgentCoordinator()
+    for name in _SUB_AGENTS:
+        setattr(coordinator, name, MagicMock(name=name))
+    return coordinator
+
 
 @pytest.fixture
-def agent_coordinator():
-    return AgentCoordinator()
+def agent_coordinator(_coordinator):
+    """Module-wide coordinator whose sub-agent mocks are reset for each test."""
+    for name in _SUB_AGENTS:
+        getattr(_coordinator, name).reset_mock(return_value=True, side_effect=True)
+    return _coordinator
 
 
 def test_evaluate_trade_opportunity_strong_buy(agent_coordinator):
-    agent_coordinator.technical_agent.analyze_trend = Mock(
-        return_value={"direction": "bullish", "strength": 0.8, "confidence": 0.9}
-    )
-    agent_coordinator.technical_agent.detect_support_resistance = Mock(
-        return_value={"support": 100, "resistance": 120}
+    agent_coordinator.technical_agent.configure_mock(
+        **{
+            "analyze_trend.return_value": {
+                "direction": "bullish",
+                "strength": 0.8,
+                "confidence": 0.9,
+            },
+            "detect_support_resistance.return_value": {"support": 100, "resistance": 120},
+            "check_bollinger_bands.return_value": {},
+        }
     )
-    agent_coordinator.technical_agent.check_bollinger_bands = Mock(return_value={})
-    agent_coordinator.sentiment_agent.analyze_volume = Mock(
-        return_value={"sentiment": "strong_interest", "strength": 0.8}
-    )
-    agent_coordinator.risk_agent.calculate_position_size = Mock(return_value=1000)
-    agent_coordinator.risk_agent.assess_trade_risk = Mock(
-        return_value={"approved": True, "risk_score": 0.1}
-    )
-    agent_coordinator.execution_agent.determine_entry_timing = Mock(
-        return_value={"urgency": 0.9}
+    agent_coordinator.sentiment_agent.analyze_volume.return_value = {
+        "sentiment": "strong_interest",
+        "strength": 0.8,
+    }
+    agent_coordinator.risk_agent.configure_mock(
+        **{
+            "calculate_position_size.return_value": 1000,
+            "assess_trade_risk.return_value": {"approved": True, "risk_score": 0.1},
+        }
     )
+    agent_coordinator.execution_agent.determine_entry_timing.return_value = {"urgency": 0.9}
     result = agent_coordinator.evaluate_trade_opportunity(
-        symbol="AAPL", prices=[100.0] * 20, volumes=[1000] * 20, portfolio_value=10000
+        symbol="AAPL", prices=PRICES, volumes=VOLUMES, portfolio_value=10000
     )
     assert result["recommendation"] in ["buy", "strong_buy"]
     assert result["symbol"] == "AAPL"
@@ -36,22 +58,30 @@ def test_evaluate_trade_opportunity_strong_buy(agent_coordinator):
 
 
 def test_evaluate_trade_opportunity_risk_rejection(agent_coordinator):
-    agent_coordinator.technical_agent.analyze_trend = Mock(
-        return_value={"direction": "bullish", "strength": 0.8, "confidence": 0.9}
-    )
-    agent_coordinator.technical_agent.detect_support_resistance = Mock(return_value={})
-    agent_coordinator.technical_agent.check_bollinger_bands = Mock(return_value={})
-    agent_coordinator.sentiment_agent.analyze_volume = Mock(
-        return_value={"strength": 0.5}
-    )
-    agent_coordinator.risk_agent.calculate_position_size = Mock(return_value=1000)
-    agent_coordinator.risk_agent.assess_trade_risk = Mock(
-        return_value={"approved": False, "risk_score": 0.9, "reason": "Too risky"}
+    agent_coordinator.technical_agent.configure_mock(
+        **{
+            "analyze_trend.return_value": {
+                "direction": "bullish",
+                "strength": 0.8,
+                "confidence": 0.9,
+            },
+            "detect_support_resistance.return_value": {},
+            "check_bollinger_bands.return_value": {},
+        }
     )
-    agent_coordinator.execution_agent.determine_entry_timing = Mock(
-        return_value={"urgency": 0.5}
+    agent_coordinator.sentiment_agent.analyze_volume.return_value = {"strength": 0.5}
+    agent_coordinator.risk_agent.configure_mock(
+        **{
+            "calculate_position_size.return_value": 1000,
+            "assess_trade_risk.return_value": {
+                "approved": False,
+                "risk_score": 0.9,
+                "reason": "Too risky",
+            },
+        }
     )
+    agent_coordinator.execution_agent.determine_entry_timing.return_value = {"urgency": 0.5}
     result = agent_coordinator.evaluate_trade_opportunity(
-        symbol="AAPL", prices=[100.0] * 20, volumes=[1000] * 20, portfolio_value=10000
+        symbol="AAPL", prices=PRICES, volumes=VOLUMES, portfolio_value=10000
     )
     assert result["recommendation"] == "reject"
@@ -1,13 +1,8 @@
+import json
 from unittest.mock import AsyncMock
 
 import pytest
 from fastapi import WebSocket
-from pythia.application.websocket_manager import ConnectionManager
-
-
-@pytest.fixture
-def connection_manager():
-    return ConnectionManager()
 
 
 @pytest.fixture
@@ -42,4 +37,18 @@ async def test_broadcast(connection_manager, mock_websocket):
     await connection_manager.connect(mock_websocket)
     message = {"type": "test", "data": "hello"}
     await connection_manager.broadcast(message)
-    mock_websocket.send_json.assert_called_with(message)
+    mock_websocket.send_text.assert_called_once_with(
+        json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+    )
+
+
+@pytest.mark.asyncio
+async def test_broadcast_drops_closed_connections(connection_manager, mock_websocket):
+    closed = AsyncMock(spec=WebSocket)
+    closed.send_text.side_effect = RuntimeError("closed")
+    await connection_manager.connect(mock_websocket)
+    await connection_manager.connect(closed)
+    await connection_manager.broadcast({"type": "test"})
+    mock_websocket.send_text.assert_called_once()
+    assert closed not in connection_manager.active_connections
+    assert mock_websocket in connection_manager.active_connections
@@ -1,27 +1,29 @@
+from dataclasses import replace
+
 import pytest
+from pythia.application.trading.arbitrage_detector import ArbitrageDetector
 from pythia.domain.markets.prediction_market import PredictionMarket
 
+_BASE_KALSHI = PredictionMarket(
+    market_id="FED-MAR-T5.25",
+    description="Fed rate hike to 5.25%",
+    yes_price=0.42,
+    no_price=0.58,
+    platform="kalshi",
+    volume=50000,
+)
+_BASE_POLY = PredictionMarket(
+    market_id="0x1234",
+    description="Fed rate hike to 5.25%",
+    yes_price=0.46,
+    no_price=0.56,
+    platform="polymarket",
+    volume=120000,
+)
 
-def test_arbitrage_detection():
-    kalshi = PredictionMarket(
-        market_id="FED-MAR-T5.25",
-        description="Fed rate hike to 5.25%",
-        yes_price=0.42,
-        no_price=0.58,
-        platform="kalshi",
-        volume=50000,
-    )
 
-    polymarket = PredictionMarket(
-        market_id="0x1234",
-        description="Fed rate hike to 5.25%",
-        yes_price=0.46,
-        no_price=0.56,
-        platform="polymarket",
-        volume=120000,
-    )
-
-    arb = kalshi.arbitrage_opportunity(polymarket)
+def test_arbitrage_detection():
+    arb = _BASE_KALSHI.arbitrage_opportunity(_BASE_POLY)
 
     assert arb is not None
     assert arb["cost"] == 0.98
@@ -29,8 +31,73 @@ def test_arbitrage_detection():
     assert arb["roi"] == pytest.approx(0.0204, rel=0.01)
 
 
+@pytest.mark.parametrize(
+    "k_yes,k_no,p_yes,p_no,expected_cost",
+    [
+        (0.42, 0.58, 0.46, 0.56, 0.98),
+        (0.45, 0.55, 0.55, 0.45, 0.90),
+        (0.50, 0.50, 0.50, 0.50, None),
+        (0.60, 0.42, 0.50, 0.52, 0.92),
+    ],
+    ids=["forward-leg", "wide-spread", "fair-priced", "reverse-leg"],
+)
+def test_arbitrage_price_variants(k_yes, k_no, p_yes, p_no, expected_cost):
+    kalshi = replace(_BASE_KALSHI, yes_price=k_yes, no_price=k_no)
+    poly = replace(_BASE_POLY, yes_price=p_yes, no_price=p_no)
+
+    arb = kalshi.arbitrage_opportunity(poly)
+
+    if expected_cost is None:
+        assert arb is None
+    else:
+        assert arb["cost"] == pytest.approx(expected_cost)
+
+
 def test_no_arbitrage_when_overpriced():
     m1 = PredictionMarket("T1", "Test", 0.60, 0.45, "kalshi", 1000)
     m2 = PredictionMarket("T2", "Test", 0.55, 0.40, "polymarket", 1000)
 
     assert m1.arbitrage_opportunity(m2) is None
+
+
+def test_from_raw_matches_keyword_constructor():
+    row = {
+        "market_id": "FED-MAR-T5.25",
+        "description": "  Fed Rate Hike to 5.25%  ",
+        "yes_price": 0.42,
+        "no_price": 0.58,
+    }
+    market = PredictionMarket.from_raw(row, "kalshi")
+
+    assert market == PredictionMarket(
+        "FED-MAR-T5.25", "  Fed Rate Hike to 5.25%  ", 0.42, 0.58, "kalshi", 0
+    )
+    assert market.match_key == "fed rate hike to 525"
+    assert not hasattr(market, "__dict__")
+
+
+def test_match_key_ignores_case_punctuation_and_spacing():
+    a = PredictionMarket("K1", "Fed rate hike?", 0.4, 0.6, "kalshi", 0)
+    b = PredictionMarket("P1", " FED  Rate Hike!", 0.4, 0.6, "polymarket", 0)
+
+    assert a.match_key == b.match_key == "fed rate hike"
+
+
+def test_picks_cheaper_reverse_leg():
+    m1 = PredictionMarket("T1", "Test", 0.60, 0.40, "kalshi", 1000)
+    m2 = PredictionMarket("T2", "Test", 0.50, 0.45, "polymarket", 1000)
+
+    arb = m1.arbitrage_opportunity(m2)
+
+    assert arb["cost"] == pytest.approx(0.90)
+    assert arb["strategy"] == "BUY NO on kalshi, BUY YES on polymarket"
+
+
+def test_near_identical_descriptions_with_different_tokens_match():
+    kalshi = PredictionMarket("K1", "Presidential2028", 0.42, 0.58, "kalshi", 0)
+    poly = PredictionMarket("P1", "Presidential 2028", 0.45, 0.53, "polymarket", 0)
+
+    opportunities = ArbitrageDetector(min_roi=0.01).find_opportunities([kalshi], [poly])
+
+    assert len(opportunities) == 1
+    assert opportunities[0]["cost"] == pytest.approx(0.95)
@@ -1,7 +1,7 @@
 import pytest
 import asyncio
 import logging
-import json
+import orjson
 import zmq.asyncio
 import sys
 import os
@@ -18,67 +18,77 @@ from pythia.infrastructure.messaging.system_bus import SystemBus, ConnectionStat
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger("TestIntegration")
 
+DATA_PORT = 5560  # Use test port
+
+
+@pytest.fixture(scope="module")
+def service_bus():
+    """Service Bus (REP), bound once and shared by every cycle in the module."""
+    bus = SystemBus({"system": {"ports": {"data": DATA_PORT}}})
+    bus.setup_data_endpoint()
+    yield bus
+    bus.data_socket.close(linger=0)
+    bus.context.term()
+
+
+@pytest.fixture(scope="module")
+def zmq_ctx():
+    ctx = zmq.asyncio.Context()
+    yield ctx
+    ctx.term()
+
+
+@pytest.fixture(scope="module")
+def client_socket(zmq_ctx):
+    """Client Socket (REQ), connected once; LINGER 0 keeps teardown from stalling."""
+    sock = zmq_ctx.socket(zmq.REQ)
+    sock.setsockopt(zmq.LINGER, 0)
+    sock.connect(f"tcp://127.0.0.1:{DATA_PORT}")
+    yield sock
+    sock.close()
+
+
 @pytest.mark.asyncio
-async def test_bus_rep_req_cycle():
+@pytest.mark.parametrize(
+    "payload",
+    [{"test": "ping"}, {"test": "ping", "seq": 2}, {"test": "ping", "seq": 3}],
+)
+async def test_bus_rep_req_cycle(service_bus, client_socket, payload):
     """
     Verifies that SystemBus can handle DATA requests correctly.
     Simulates: Service (REP) <-> Client (REQ)
     """
-    # 1. Setup Service Bus (REP)
-    service_config = {
-        "system": {
-            "ports": {"data": 5560} # Use test port
-        }
-    }
-    service_bus = SystemBus(service_config)
-    service_bus.setup_data_endpoint()
-    
     assert service_bus._states['data'] == ConnectionState.CONNECTED
-    
-    # 2. Setup Client Socket (REQ)
-    ctx = zmq.asyncio.Context()
-    client_socket = ctx.socket(zmq.REQ)
-    client_socket.connect("tcp://127.0.0.1:5560")
-    
-    # 3. Async Task for Service Loop
+
+    # 1. Async Task for Service Loop
     async def service_loop():
         logger.info("Service Loop Started")
         try:
-            # Wait for request (timeout 2s)
+            # Wait for request (timeout 5s)
             req = await service_bus.handle_data_request()
             return req
         except Exception as e:
             logger.error(f"Service Error: {e}")
             return None
 
-    # 4. Async Task for Client
+    # 2. Async Task for Client
     async def client_task():
         logger.info("Client Sending Request")
-        await client_socket.send_json({"test": "ping"})
-        reply = await client_socket.recv_json()
+        # orjson instead of pyzmq's stdlib-json send_json/recv_json; the bus
+        # reads the frame with recv_string, so UTF-8 JSON bytes are all it needs.
+        await client_socket.send(orjson.dumps(payload))
+        reply = orjson.loads(await client_socket.recv())
         return reply
 
-    # 5. Run Concurrent
-    server_task = asyncio.create_task(service_loop())
-    client_task = asyncio.create_task(client_task())
-    
-    # Wait
-    results = await asyncio.gather(server_task, client_task)
-    
-    received_req = results[0]
-    received_reply = results[1]
-    
-    # 6. Verify
-    assert received_req == {"test": "ping"}
+    # 3. Run Concurrent
+    received_req, received_reply = await asyncio.gather(service_loop(), client_task())
+
+    # 4. Verify
+    assert received_req == payload
     assert received_reply == {"status": "ack"}
-    
-    # Cleanup
-    service_bus.data_socket.close()
-    client_socket.close()
-    ctx.term()
     print("TEST PASSED: SystemBus REP/REQ Cycle Verified")
 
 if __name__ == "__main__":
     if sys.platform == 'win32':
         asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
-    asyncio.run(test_bus_rep_req_cycle())
+    raise SystemExit(pytest.main([__file__]))
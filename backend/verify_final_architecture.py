@@ -14,6 +14,7 @@ import asyncio
 import sys
 import os
 import logging
+from collections import deque
 
 # SOTA Path Injection
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -33,11 +34,17 @@ logger = logging.getLogger("Verification")
 # Mocks
 class MockDB:
     def __init__(self):
-        self.events = []
+        self.events = deque()
     def add(self, item):
         self.events.append(item)
+    def add_all(self, items):
+        self.events.extend(items)
+    def flush(self):
+        pass
     def commit(self):
         pass
+    def rollback(self):
+        pass
     def refresh(self, item):
         pass
     def close(self):
@@ -82,8 +89,16 @@ async def compensate_order(order_id):
 
 async def log_event():
     logger.info("[Step 3] Log Event (Event Sourcing)...")
-    # We use a mock session here so we don't need real DB
-    store.append("saga-test-1", "SagaCompleted", {"status": "success"})
+    # We use a mock session here so we don't need real DB; the saga's events
+    # go in as one batch, i.e. a single add_all + commit.
+    store.append_batch(
+        "saga-test-1",
+        [
+            ("FundsReserved", {"status": "success"}),
+            ("OrderPlaced", {"order_id": "ord-abc-123"}),
+            ("SagaCompleted", {"status": "success"}),
+        ],
+    )
 
 async def compensate_log():
     pass
@@ -47,14 +47,13 @@ async def verify_exchange_connectivity():
         if settings.EXCHANGE_TESTNET:
             exchange.set_sandbox_mode(True)
             
-        # 1. Test Public REST (Time/Server)
-        logger.info(">>> STEP 1: REST Connectivity...")
-        time_sync = await exchange.fetch_time()
+        # 1 + 2. Public REST (Time/Server) and Authenticated REST (Balance);
+        # independent round trips, so they are in flight together.
+        logger.info(">>> STEP 1+2: REST Connectivity + Authentication (Balance Check)...")
+        time_sync, balance = await asyncio.gather(
+            exchange.fetch_time(), exchange.fetch_balance()
+        )
         logger.info(f"Exchange Time: {time_sync}")
-        
-        # 2. Test Authenticated REST (Balance)
-        logger.info(">>> STEP 2: Authentication (Balance Check)...")
-        balance = await exchange.fetch_balance()
         logger.info(f"Balance Retrieved. Total USD: {balance.get('total', {}).get('USDT', 0)}")
         
         # 3. Test WebSocket (Ticker)